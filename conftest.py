@@ -0,0 +1,163 @@
+"""Shared fixtures for the root-level test_*.py suites."""
+
+import asyncio
+import importlib
+import logging
+import os
+
+import pytest
+import pytest_asyncio
+
+from gaggle.core.communication.bus import MessageBus
+from gaggle.core.state.context import ContextManager
+from gaggle.models.story import StoryPriority, UserStory
+from gaggle.utils.cost_calculator import CostCalculator
+from gaggle.utils.token_counter import TokenCounter
+
+# uvloop's libuv loop schedules short coroutines faster; optional, not on Windows
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
+# Eager tasks (3.12+) run a new task inline until its first real suspension
+EAGER_TASKS_AVAILABLE = hasattr(asyncio, "eager_task_factory")
+
+# Opt-in event-loop profiling: debug mode plus a report of slow callbacks
+PROFILE_ASYNCIO = bool(os.getenv("GAGGLE_PROFILE_ASYNCIO"))
+SLOW_CALLBACK_SECONDS = 0.05
+# Outside profiling, only flag callbacks slow enough to be real problems, so
+# ad-hoc debug-mode runs do not drown in false-positive warnings
+DEBUG_SLOW_CALLBACK_SECONDS = 2.0
+
+
+class _SlowCallbackRecorder(logging.Handler):
+    """Collect asyncio's debug-mode "Executing <handle> took N seconds" warnings."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.slow_callbacks: list[tuple[float, str]] = []
+
+    def emit(self, record):
+        if str(record.msg).startswith("Executing") and len(record.args) == 2:
+            handle, seconds = record.args
+            self.slow_callbacks.append((seconds, str(handle)))
+
+
+_slow_callbacks = _SlowCallbackRecorder()
+
+
+def pytest_configure(config):
+    """Collect coverage only when GAGGLE_COVERAGE is set, as CI does.
+
+    pytest-cov starts its controller before any conftest is read, so a
+    local run has to pause it and drop the plugin rather than just flip
+    ``--no-cov``; that keeps ``.coverage`` data and ``htmlcov/`` unwritten.
+    ``--collect-only`` never measures anything, so it skips coverage too
+    (xdist already declines to start workers for it).
+    """
+    if PROFILE_ASYNCIO:
+        # pytest-asyncio applies its own debug setting to every loop it runs
+        config.option.asyncio_debug = True
+        logging.getLogger("asyncio").addHandler(_slow_callbacks)
+    if os.getenv("GAGGLE_COVERAGE") and not config.option.collectonly:
+        return
+    config.option.no_cov = True
+    cov_plugin = config.pluginmanager.get_plugin("_cov")
+    if cov_plugin is None:
+        return
+    if cov_plugin.cov_controller is not None:
+        cov_plugin.cov_controller.pause()
+    config.pluginmanager.unregister(cov_plugin)
+
+
+def _new_event_loop():
+    """Create the test event loop: uvloop if present, with eager tasks on 3.12+."""
+    loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+    if EAGER_TASKS_AVAILABLE:
+        loop.set_task_factory(asyncio.eager_task_factory)
+    loop.slow_callback_duration = (
+        SLOW_CALLBACK_SECONDS if PROFILE_ASYNCIO else DEBUG_SLOW_CALLBACK_SECONDS
+    )
+    return loop
+
+
+# The hook is new in pytest-asyncio 1.4.0; older versions skip it instead of failing
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests and fixtures on the tuned loop, not the default one."""
+    return {"uvloop" if UVLOOP_AVAILABLE else "asyncio": _new_event_loop}
+
+
+def pytest_terminal_summary(terminalreporter):
+    """With GAGGLE_PROFILE_ASYNCIO set, list the slowest event-loop callbacks."""
+    if not PROFILE_ASYNCIO:
+        return
+    terminalreporter.section("slowest event-loop callbacks")
+    slowest = sorted(_slow_callbacks.slow_callbacks, reverse=True)[:10]
+    if not slowest:
+        terminalreporter.write_line(f"none over {SLOW_CALLBACK_SECONDS * 1000:.0f}ms")
+    for seconds, handle in slowest:
+        terminalreporter.write_line(f"{seconds * 1000:8.1f}ms  {handle}")
+
+
+# Subpackages loaded eagerly once per session; gaggle.main stays lazy
+_WARM_PACKAGES = (
+    "gaggle.core",
+    "gaggle.utils",
+    "gaggle.models",
+    "gaggle.tools",
+    "gaggle.agents",
+    "gaggle.workflows",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_gaggle():
+    """Import the gaggle subpackages up front so tests share one sys.modules."""
+    for name in _WARM_PACKAGES:
+        importlib.import_module(name)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def message_bus():
+    """One started MessageBus per session, stopped once at teardown."""
+    bus = MessageBus()
+    await bus.start()
+    yield bus
+    await bus.stop()
+
+
+@pytest.fixture(scope="session")
+def cost_calculator():
+    """One CostCalculator per session; it holds no per-call state."""
+    return CostCalculator()
+
+
+@pytest.fixture(scope="session")
+def context_manager():
+    """One ContextManager per session; tests keep to their own agent IDs."""
+    return ContextManager()
+
+
+@pytest.fixture(scope="session")
+def sample_story():
+    """Read-only user story shared by the agent planning tests."""
+    return UserStory(
+        id="US-001",
+        title="User Login",
+        description="User authentication feature",
+        priority=StoryPriority.HIGH,
+        story_points=5,
+    )
+
+
+@pytest.fixture
+def fresh_counter():
+    """Fresh TokenCounter per test, since tests mutate and reset it."""
+    counter = TokenCounter()
+    yield counter
+    counter.reset()
@@ -9,6 +9,8 @@ __version__ = "0.1.0"
 __author__ = "Dan Oliver"
 __email__ = "dan@example.com"
 
+import importlib
+
 from .core.backlog import ProductBacklog
 from .core.sprint import Sprint
 from .core.team import Team
@@ -24,3 +26,12 @@ __all__ = [
     "UserStory",
     "Task",
 ]
+
+# Heavy submodules (the Typer/Rich CLI, tools, workflows) load on first access
+_LAZY_SUBMODULES = frozenset({"main", "tools", "workflows"})
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -167,11 +167,20 @@ class BaseAgent(ABC):
 
         try:
             # Execute the task using the Strands agent
-            result = await self._agent.aexecute(task, **kwargs)
+            response = await self._agent.aexecute(task, **kwargs)
+
+            # The adapter answers with a dict of text plus usage; anything else
+            # (a Strands result object, a plain string) is the result itself
+            if isinstance(response, dict):
+                result = response.get("result", "")
+                token_usage = response.get("token_usage")
+            else:
+                result = response
+                token_usage = getattr(response, "token_usage", None)
 
             # Track token usage if available
-            if hasattr(result, "token_usage"):
-                self._track_token_usage(result.token_usage)
+            if token_usage:
+                self._track_token_usage(token_usage)
 
             self.task_count += 1
 
@@ -196,7 +205,7 @@ class BaseAgent(ABC):
                 "result": result,
                 "agent": self.name,
                 "role": self.role.value,
-                "tokens_used": getattr(result, "token_usage", None),
+                "tokens_used": token_usage,
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
@@ -36,6 +36,9 @@ class GaggleSettings(BaseSettings):
         None, description="Token budget per sprint"
     )
     cost_tracking_enabled: bool = Field(True, description="Enable cost tracking")
+    prompt_caching_enabled: bool = Field(
+        True, description="Mark system prompts as cacheable for Claude prompt caching"
+    )
     max_cost_per_sprint: float | None = Field(
         None, description="Maximum cost per sprint in USD"
     )
@@ -1,10 +1,11 @@
 """Adaptive sprint planning with dynamic velocity and risk assessment."""
 
 import logging
+import math
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from statistics import mean, median
+from statistics import median
 
 from ...config.models import AgentRole
 from ...models import Sprint, Task, TaskStatus, UserStory
@@ -29,7 +30,7 @@ class VelocityMetric(Enum):
     EFFORT_HOURS = "effort_hours"
 
 
-@dataclass
+@dataclass(slots=True)
 class SprintMetrics:
     """Comprehensive sprint performance metrics."""
 
@@ -129,6 +130,11 @@ class RiskAssessment:
         ]
 
 
+def _mean(values: list[float]) -> float:
+    """Arithmetic mean via fsum, far cheaper than statistics.mean's Fractions."""
+    return math.fsum(values) / len(values)
+
+
 class VelocityTracker:
     """Tracks and predicts team velocity over time."""
 
@@ -144,6 +150,12 @@ class VelocityTracker:
         if len(self.sprint_history) > self.history_window:
             self.sprint_history = self.sprint_history[-self.history_window :]
 
+    def add_many(self, metrics: list[SprintMetrics]) -> None:
+        """Add several completed sprints, trimming the history once."""
+        self.sprint_history.extend(metrics)
+        if len(self.sprint_history) > self.history_window:
+            self.sprint_history = self.sprint_history[-self.history_window :]
+
     def predict_velocity(
         self,
         metric: VelocityMetric = VelocityMetric.STORY_POINTS,
@@ -156,17 +168,17 @@ class VelocityTracker:
         velocities = [sprint.velocity(metric) for sprint in self.sprint_history]
 
         if method == "moving_average":
-            return mean(velocities) if velocities else 0.0
+            return _mean(velocities) if velocities else 0.0
         elif method == "median":
             return median(velocities) if velocities else 0.0
         elif method == "weighted_recent":
             # Weight recent sprints more heavily
-            weights = [i + 1 for i in range(len(velocities))]
-            weighted_sum = sum(v * w for v, w in zip(velocities, weights, strict=False))
-            weight_total = sum(weights)
+            n = len(velocities)
+            weighted_sum = sum(v * w for w, v in enumerate(velocities, start=1))
+            weight_total = n * (n + 1) // 2
             return weighted_sum / weight_total if weight_total > 0 else 0.0
         else:
-            return mean(velocities) if velocities else 0.0
+            return _mean(velocities) if velocities else 0.0
 
     def velocity_trend(self) -> str:
         """Analyze velocity trend over time."""
@@ -176,13 +188,13 @@ class VelocityTracker:
         recent_velocities = [sprint.velocity() for sprint in self.sprint_history[-3:]]
 
         if len(recent_velocities) >= 2:
-            recent_avg = mean(recent_velocities)
+            recent_avg = _mean(recent_velocities)
             older_velocities = [
                 sprint.velocity() for sprint in self.sprint_history[:-3]
             ]
 
             if older_velocities:
-                older_avg = mean(older_velocities)
+                older_avg = _mean(older_velocities)
                 if recent_avg > older_avg * 1.1:
                     return "improving"
                 elif recent_avg < older_avg * 0.9:
@@ -308,8 +320,7 @@ class AdaptiveSprintPlanner:
         logger.info(f"Starting adaptive planning for sprint {sprint.id}")
 
         # Update velocity tracking
-        for metrics in historical_metrics:
-            self.velocity_tracker.add_sprint_metrics(metrics)
+        self.velocity_tracker.add_many(historical_metrics)
 
         # Predict capacity
         predicted_velocity = self.velocity_tracker.predict_velocity()
@@ -35,9 +35,12 @@ class LearningCategory(Enum):
     QUALITY_IMPROVEMENT = "quality_improvement"
 
 
-@dataclass
+@dataclass(slots=True)
 class CoordinationEvent:
-    """Individual coordination event for pattern analysis."""
+    """Individual coordination event for pattern analysis.
+
+    Recorded in bulk, so instances use slots rather than a per-event __dict__.
+    """
 
     timestamp: datetime
     event_type: str
@@ -225,8 +225,10 @@ class TestSuite:
 class ParallelTester:
     """Manages parallel execution of multiple test suites."""
 
-    def __init__(self, max_concurrent_tests: int = 4):
+    def __init__(self, max_concurrent_tests: int = 4, simulated_duration: float = 0.1):
         self.max_concurrent_tests = max_concurrent_tests
+        # Seconds each simulated suite takes; 0 for unit tests of this class
+        self.simulated_duration = simulated_duration
         self.test_suites: dict[TestType, TestSuite] = {}
         self.executor = ThreadPoolExecutor(max_workers=max_concurrent_tests)
 
@@ -291,7 +293,7 @@ class ParallelTester:
             logger.info(f"Starting {test_suite.name}")
 
             # Simulate test execution (in real implementation, this would run actual tests)
-            await asyncio.sleep(0.1)  # Simulate test execution time
+            await asyncio.sleep(self.simulated_duration)  # Simulate test execution
 
             # Mock successful test results
             success = True
@@ -13,6 +13,7 @@ from .compression import (
     CompressionResult,
     ContextCompressor,
     HierarchicalCompressor,
+    MemoryCompressor,
     SummaryCompressor,
     TemplateCompressor,
 )
@@ -55,5 +56,6 @@ __all__ = [
     "SummaryCompressor",
     "TemplateCompressor",
     "HierarchicalCompressor",
+    "MemoryCompressor",
     "CompressionResult",
 ]
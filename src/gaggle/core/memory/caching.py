@@ -5,6 +5,7 @@ import logging
 import pickle
 import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -28,7 +29,7 @@ class CacheKey:
     """Unique identifier for cached content."""
 
     cache_type: CacheType
-    content_hash: str
+    content_hash: bytes  # First 16 bytes of the SHA-256 digest
     agent_role: AgentRole | None = None
     model_tier: ModelTier | None = None
     version: str = "1.0"
@@ -37,7 +38,7 @@ class CacheKey:
         """String representation for storage keys."""
         parts = [
             self.cache_type.value,
-            self.content_hash[:16],  # Truncate hash for readability
+            self.content_hash[:8].hex(),  # Truncate hash for readability
             self.agent_role.value if self.agent_role else "any",
             self.model_tier.value if self.model_tier else "any",
             self.version,
@@ -54,7 +55,10 @@ class CacheKey:
         version: str = "1.0",
     ) -> "CacheKey":
         """Create cache key from content."""
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        # One-shot SHA-256 runs on OpenSSL's SHA-NI path, which outpaces
+        # BLAKE2b on multi-KB prompts; keep it rather than a "faster" hash.
+        # A raw 128-bit prefix is half the size of the 64-char hex string.
+        content_hash = hashlib.sha256(content.encode()).digest()[:16]
         return cls(cache_type, content_hash, agent_role, model_tier, version)
 
 
@@ -126,7 +130,7 @@ class CacheEntry:
         return {
             "key": {
                 "cache_type": self.key.cache_type.value,
-                "content_hash": self.key.content_hash,
+                "content_hash": self.key.content_hash.hex(),
                 "agent_role": (
                     self.key.agent_role.value if self.key.agent_role else None
                 ),
@@ -407,8 +411,8 @@ class PromptCache:
         self.max_size = max_size
         self.enable_persistence = enable_persistence
 
-        # Cache storage
-        self.cache: dict[str, CacheEntry] = {}
+        # Cache storage, kept in least- to most-recently-used order
+        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
 
         # Caching strategies
         self.strategies = [TemplateCacher(), ComponentCacher(), PatternCacher()]
@@ -445,6 +449,7 @@ class PromptCache:
 
                     # Check if cache is still fresh
                     if not entry.is_expired():
+                        self.cache.move_to_end(key_str)
                         entry.access()
                         self.stats["cache_hits"] += 1
 
@@ -498,12 +503,9 @@ class PromptCache:
         if original_tokens > 0:
             entry.compression_ratio = cached_tokens / original_tokens
 
-        # Enforce cache size limit
-        self._enforce_cache_size()
-
         # Store entry
         key_str = str(cache_key)
-        self.cache[key_str] = entry
+        self._insert(key_str, entry)
 
         self.logger.debug(f"Cached content with key: {key_str}")
 
@@ -513,6 +515,31 @@ class PromptCache:
 
         return True
 
+    def store(self, key: str, value: Any) -> None:
+        """Cache a value under an explicit key, bypassing the strategies."""
+        entry = CacheEntry(
+            key=CacheKey.from_content(CacheType.RESPONSE, key), content=value
+        )
+        self._insert(key, entry)
+
+    def retrieve(self, key: str) -> Any | None:
+        """Return the value stored under an explicit key, or None."""
+        self.stats["total_requests"] += 1
+        entry = self.cache.get(key)
+        if entry is None or entry.is_expired():
+            self.cache.pop(key, None)
+            self.stats["cache_misses"] += 1
+            return None
+
+        self.cache.move_to_end(key)
+        entry.access()
+        self.stats["cache_hits"] += 1
+        return entry.content
+
+    def clear(self) -> None:
+        """Alias for clear_cache()."""
+        self.clear_cache()
+
     def record_savings(
         self, cache_key: str, tokens_saved: int, cost_saved: float
     ) -> None:
@@ -582,30 +609,18 @@ class PromptCache:
         }
         self.logger.info("Cache cleared")
 
+    def _insert(self, key_str: str, entry: CacheEntry) -> None:
+        """Store an entry as most recently used, evicting LRU entries."""
+        self.cache[key_str] = entry
+        self.cache.move_to_end(key_str)
+        self._enforce_cache_size()
+
     def _enforce_cache_size(self) -> None:
-        """Enforce cache size limits by evicting least useful entries."""
-        if len(self.cache) >= self.max_size:
-            # Calculate eviction scores
-            scored_entries = []
-            for key_str, entry in self.cache.items():
-                # Score based on freshness, hit count, and savings
-                freshness = entry.calculate_freshness()
-                hit_score = min(entry.hit_count / 10.0, 1.0)
-                savings_score = min(entry.token_savings / 1000.0, 1.0)
-
-                eviction_score = freshness * 0.4 + hit_score * 0.4 + savings_score * 0.2
-                scored_entries.append((key_str, entry, eviction_score))
-
-            # Sort by eviction score (ascending - worst first)
-            scored_entries.sort(key=lambda x: x[2])
-
-            # Evict worst 20%
-            num_to_evict = max(1, len(self.cache) // 5)
-            for key_str, _, _ in scored_entries[:num_to_evict]:
-                del self.cache[key_str]
-                self.stats["evictions"] += 1
-
-            self.logger.debug(f"Evicted {num_to_evict} cache entries due to size limit")
+        """Enforce cache size limits by evicting least recently used entries."""
+        while len(self.cache) > self.max_size:
+            key_str, _ = self.cache.popitem(last=False)
+            self.stats["evictions"] += 1
+            self.logger.debug(f"Evicted cache entry due to size limit: {key_str}")
 
     def _calculate_average_compression(self) -> float:
         """Calculate average compression ratio across all cached entries."""
@@ -637,7 +652,7 @@ class PromptCache:
                 key_data = entry_data["key"]
                 cache_key = CacheKey(
                     cache_type=CacheType(key_data["cache_type"]),
-                    content_hash=key_data["content_hash"],
+                    content_hash=bytes.fromhex(key_data["content_hash"])[:16],
                     agent_role=(
                         AgentRole(key_data["agent_role"])
                         if key_data["agent_role"]
@@ -1,14 +1,43 @@
 """Context compression for efficient memory usage and token reduction."""
 
+import hashlib
 import json
 import logging
+import random
 import re
+import zlib
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass
 from typing import Any
 
 from .hierarchical import MemoryItem, MemoryLevel
 
+# Seeded (a*h + b) mod p permutations for near-duplicate sentence detection,
+# banded for LSH: 8 bands of 2 rows make a pair at Jaccard 0.8 a candidate
+# ~99.97% of the time
+_MERSENNE_61 = (1 << 61) - 1
+_LSH_BANDS = 8
+_SHINGLE_SIZE = 5
+
+
+def _minhash_permutations(count: int, seed: int = 0) -> tuple[tuple[int, int], ...]:
+    """Draw fixed (a, b) coefficients for ``(a*h + b) mod 2**61-1`` permutations."""
+    rng = random.Random(seed)
+    return tuple(
+        (rng.randrange(1, _MERSENNE_61), rng.randrange(_MERSENNE_61))
+        for _ in range(count)
+    )
+
+
+_MINHASH_PERMUTATIONS = _minhash_permutations(16)
+
+
+def _stable_hash(text: str) -> int:
+    """Hash text to 64 bits, identically in every process."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
 
 @dataclass
 class CompressionResult:
@@ -59,10 +88,11 @@ class ContextCompressor(ABC):
 class SummaryCompressor(ContextCompressor):
     """Compress context by creating intelligent summaries."""
 
-    def __init__(self, max_summary_ratio: float = 0.3):
+    def __init__(self, max_summary_ratio: float = 0.3, dedup_threshold: float = 0.8):
         self.max_summary_ratio = (
             max_summary_ratio  # Max summary size as ratio of original
         )
+        self.dedup_threshold = dedup_threshold  # Jaccard at which sentences merge
         self.logger = logging.getLogger("compression.summary")
 
         # Key information patterns
@@ -84,7 +114,7 @@ class SummaryCompressor(ContextCompressor):
         summary_parts = []
 
         # 1. Extract sentences with key patterns
-        sentences = self._split_into_sentences(content)
+        sentences = self._dedupe_sentences(self._split_into_sentences(content))
         key_sentences = self._extract_key_sentences(sentences)
 
         # 2. Extract structured data (JSON, lists, etc.)
@@ -150,6 +180,58 @@ class SummaryCompressor(ContextCompressor):
         sentences = re.split(r"[.!?]+\s+", text)
         return [s.strip() for s in sentences if s.strip()]
 
+    def _dedupe_sentences(self, sentences: list[str]) -> list[str]:
+        """Drop near-duplicate sentences, keeping the first of each group.
+
+        MinHash-LSH buckets sentences by banded signatures so only bucket
+        collisions get an exact Jaccard check, keeping the pass linear.
+        """
+        rows = len(_MINHASH_PERMUTATIONS) // _LSH_BANDS
+        buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+        kept: list[str] = []
+        kept_shingles: list[frozenset[int]] = []
+
+        for sentence in sentences:
+            shingles = self._shingle(sentence)
+            signature = [
+                min((a * h + b) % _MERSENNE_61 for h in shingles)
+                for a, b in _MINHASH_PERMUTATIONS
+            ]
+            band_keys = [
+                (band, tuple(signature[band * rows : (band + 1) * rows]))
+                for band in range(_LSH_BANDS)
+            ]
+
+            candidates = {idx for key in band_keys for idx in buckets.get(key, ())}
+            if any(
+                len(shingles & kept_shingles[idx]) / len(shingles | kept_shingles[idx])
+                >= self.dedup_threshold
+                for idx in candidates
+            ):
+                continue
+
+            for key in band_keys:
+                buckets.setdefault(key, []).append(len(kept))
+            kept.append(sentence)
+            kept_shingles.append(shingles)
+
+        return kept
+
+    @staticmethod
+    def _shingle(sentence: str) -> frozenset[int]:
+        """Hash the character shingles of a whitespace-normalised sentence.
+
+        Shingles use a 64-bit BLAKE2b digest rather than ``hash()``, which is
+        salted per process and would make the dedupe vary between runs.
+        """
+        text = " ".join(sentence.lower().split())
+        if len(text) <= _SHINGLE_SIZE:
+            return frozenset({_stable_hash(text)})
+        return frozenset(
+            _stable_hash(text[i : i + _SHINGLE_SIZE])
+            for i in range(len(text) - _SHINGLE_SIZE + 1)
+        )
+
     def _extract_key_sentences(self, sentences: list[str]) -> list[str]:
         """Extract sentences containing key information."""
         scored_sentences = []
@@ -343,28 +425,22 @@ class TemplateCompressor(ContextCompressor):
 
     def _find_repeated_patterns(self, content: str) -> dict[str, int]:
         """Find repeated text patterns."""
-        patterns = {}
-
-        # Look for repeated lines
-        lines = content.split("\n")
-        line_counts = {}
-
-        for line in lines:
-            line = line.strip()
-            if len(line) > 10:  # Ignore short lines
-                line_counts[line] = line_counts.get(line, 0) + 1
+        # Look for repeated lines, counted in one C-level pass; short lines
+        # are ignored
+        stripped = map(str.strip, content.split("\n"))
+        line_counts = Counter(line for line in stripped if len(line) > 10)
 
         # Add lines that appear multiple times
-        for line, count in line_counts.items():
-            if count > 1:
-                patterns[line] = count
+        patterns = {line: count for line, count in line_counts.items() if count > 1}
 
-        # Look for repeated phrases (simplified)
+        # Look for repeated 5-word phrases in one sliding-window pass
         words = content.split()
-        for i in range(len(words) - 4):  # 5-word phrases
-            phrase = " ".join(words[i : i + 5])
-            if len(phrase) > 20:
-                patterns[phrase] = patterns.get(phrase, 0) + 1
+        windows = zip(*(words[i:] for i in range(5)), strict=False)
+        phrase_counts = Counter(
+            phrase for phrase in map(" ".join, windows) if len(phrase) > 20
+        )
+        for phrase, count in phrase_counts.items():
+            patterns[phrase] = patterns.get(phrase, 0) + count
 
         return patterns
 
@@ -376,6 +452,59 @@ class TemplateCompressor(ContextCompressor):
         return template_id
 
 
+class MemoryCompressor:
+    """Lossless byte-level compression for stored memory content.
+
+    Unlike the ContextCompressor strategies this does not reduce tokens; it
+    shrinks persisted or cached text, so a fast zlib level is the default.
+
+    Memory items are small and share vocabulary, so a preset dictionary
+    (``zdict``) primes the compressor with that vocabulary up front. Output
+    compressed with a dictionary only decompresses with the same one.
+    """
+
+    # zlib only looks back 32KB, so a longer dictionary is dead weight
+    MAX_DICT_SIZE = 32768
+
+    def __init__(self, level: int = 1, zdict: bytes | None = None):
+        self.level = level
+        self.zdict = zdict
+
+    @classmethod
+    def from_samples(
+        cls, samples: list[str], level: int = 1, dict_size: int = MAX_DICT_SIZE
+    ) -> "MemoryCompressor":
+        """Build a compressor whose dictionary is drawn from past content.
+
+        zlib matches nearer the end of the dictionary more cheaply, so the
+        samples are joined in order and the most recent bytes are kept.
+        """
+        size = min(dict_size, cls.MAX_DICT_SIZE)
+        if size <= 0:
+            return cls(level, None)
+
+        joined = "\n".join(samples).encode("utf-8")
+        return cls(level, joined[-size:] or None)
+
+    def compress(self, content: str) -> bytes:
+        """Compress text to zlib-encoded bytes."""
+        data = content.encode("utf-8")
+        if self.zdict is None:
+            return zlib.compress(data, self.level)
+
+        compressor = zlib.compressobj(self.level, zdict=self.zdict)
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, compressed: bytes) -> str:
+        """Restore text compressed by compress()."""
+        if self.zdict is None:
+            return zlib.decompress(compressed).decode("utf-8")
+
+        decompressor = zlib.decompressobj(zdict=self.zdict)
+        data = decompressor.decompress(compressed) + decompressor.flush()
+        return data.decode("utf-8")
+
+
 class HierarchicalCompressor:
     """Main compression system that applies different strategies based on content."""
 
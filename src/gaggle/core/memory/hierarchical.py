@@ -1,7 +1,12 @@
 """Hierarchical memory system for intelligent context management."""
 
+import heapq
 import json
 import logging
+import sys
+from collections import Counter
+from collections.abc import Collection, Set
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -17,6 +22,24 @@ class MemoryLevel(Enum):
     PROCEDURAL = "procedural"  # Workflow processes and templates (permanent)
 
 
+# Retention per level; SEMANTIC and PROCEDURAL are effectively permanent
+_LEVEL_TTL = {
+    MemoryLevel.WORKING: timedelta(days=30),  # Sprint cycle
+    MemoryLevel.EPISODIC: timedelta(days=365),  # 1 year
+    MemoryLevel.SEMANTIC: timedelta(days=999999),  # Permanent
+    MemoryLevel.PROCEDURAL: timedelta(days=999999),  # Permanent
+}
+
+
+# Character n-gram width for the cross-agent prefilter
+_GRAM_SIZE = 3
+
+
+def _grams(text: str) -> set[str]:
+    """Overlapping character n-grams of ``text``."""
+    return {text[i : i + _GRAM_SIZE] for i in range(len(text) - _GRAM_SIZE + 1)}
+
+
 class RetrievalStrategy(Enum):
     """Strategies for retrieving memory items."""
 
@@ -33,7 +56,7 @@ class MemoryItem:
     id: str
     level: MemoryLevel
     content: dict[str, Any]
-    tags: set[str] = field(default_factory=set)
+    tags: frozenset[str] = field(default_factory=frozenset)
 
     # Temporal metadata
     created_at: datetime = field(default_factory=datetime.now)
@@ -54,18 +77,27 @@ class MemoryItem:
     sprint_id: str | None = None
     session_id: str | None = None
 
+    def __post_init__(self) -> None:
+        # Tags repeat across thousands of items; share one interned string each
+        self.tags = frozenset(sys.intern(tag) for tag in self.tags)
+
     def access(self) -> None:
         """Update access tracking."""
         self.last_accessed = datetime.now()
         self.access_count += 1
 
-    def calculate_relevance_score(self, query_terms: set[str]) -> float:
-        """Calculate relevance score for a query."""
+    def calculate_relevance_score(
+        self, query_terms: Set[str], now: datetime | None = None
+    ) -> float:
+        """Calculate relevance score for a query.
+
+        Scans over many items pass ``now`` so the clock is read once per scan.
+        """
         if not query_terms:
             return 0.0
 
         # Tag-based relevance
-        tag_matches = len(query_terms.intersection(self.tags))
+        tag_matches = len(query_terms & self.tags)
         tag_score = tag_matches / len(query_terms) if query_terms else 0.0
 
         # Content-based relevance (simplified)
@@ -75,7 +107,7 @@ class MemoryItem:
 
         # Temporal decay
         hours_since_access = (
-            datetime.now() - self.last_accessed
+            (now or datetime.now()) - self.last_accessed
         ).total_seconds() / 3600
         temporal_decay = self.relevance_decay**hours_since_access
 
@@ -88,20 +120,14 @@ class MemoryItem:
 
         return min(final_score * self.importance_score, 1.0)
 
+    @property
+    def expires_at(self) -> datetime:
+        """Point after which the item expires, given its current level."""
+        return self.created_at + _LEVEL_TTL[self.level]
+
     def is_expired(self) -> bool:
         """Check if memory item should be expired based on level."""
-        now = datetime.now()
-        age = now - self.created_at
-
-        # Different TTL for different levels
-        ttl_map = {
-            MemoryLevel.WORKING: timedelta(days=30),  # Sprint cycle
-            MemoryLevel.EPISODIC: timedelta(days=365),  # 1 year
-            MemoryLevel.SEMANTIC: timedelta(days=999999),  # Permanent
-            MemoryLevel.PROCEDURAL: timedelta(days=999999),  # Permanent
-        }
-
-        return age > ttl_map[self.level]
+        return datetime.now() > self.expires_at
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize memory item to dictionary."""
@@ -130,7 +156,7 @@ class MemoryItem:
             id=data["id"],
             level=MemoryLevel(data["level"]),
             content=data["content"],
-            tags=set(data.get("tags", [])),
+            tags=frozenset(data.get("tags", [])),
             created_at=datetime.fromisoformat(data["created_at"]),
             last_accessed=datetime.fromisoformat(data["last_accessed"]),
             access_count=data.get("access_count", 0),
@@ -153,7 +179,7 @@ class RetrievalResult:
     total_found: int
     retrieval_time: float
     strategy_used: RetrievalStrategy
-    query_terms: set[str]
+    query_terms: frozenset[str]
 
     # Quality metrics
     average_relevance: float = 0.0
@@ -190,14 +216,38 @@ class HierarchicalMemory:
         # Indexing for fast retrieval
         self.tag_index: dict[str, set[str]] = {}  # tag -> item_ids
         self.relationship_index: dict[str, set[str]] = {}  # item_id -> related_item_ids
+        # Trigram -> number of stored items whose lowercased content contains it
+        self.content_grams: Counter[str] = Counter()
+        self._indexed_content: dict[str, str] = {}  # item_id -> text grams came from
+
+        # Min-heap of (expires_at, item_id); entries go stale on promotion,
+        # re-store or eviction and are re-checked when they reach the top
+        self._ttl_heap: list[tuple[datetime, str]] = []
 
         self.logger = logging.getLogger(f"memory.hierarchical.{agent_id}")
 
     def store(self, item: MemoryItem) -> str:
         """Store a memory item at the appropriate level."""
+        self._insert(item)
+        self.logger.debug(f"Stored memory item {item.id} at level {item.level.value}")
+        return item.id
+
+    def store_many(self, items: list[MemoryItem]) -> list[str]:
+        """Store a batch of memory items, logging once for the whole batch."""
+        for item in items:
+            self._insert(item)
+
+        self.logger.debug(f"Stored {len(items)} memory items")
+        return [item.id for item in items]
+
+    def _insert(self, item: MemoryItem) -> None:
+        """Place an item in its level and indexes, evicting if the level is full."""
         if item.agent_id is None:
             item.agent_id = self.agent_id
 
+        # A re-store replaces the earlier copy, whichever level it was in
+        self._discard(item.id)
+
         # Check capacity and potentially evict items
         self._enforce_capacity_limits(item.level)
 
@@ -206,19 +256,23 @@ class HierarchicalMemory:
 
         # Update indexes
         self._update_indexes(item)
-
-        self.logger.debug(f"Stored memory item {item.id} at level {item.level.value}")
-        return item.id
+        self._push_expiry(item)
 
     def retrieve(
         self,
-        query_terms: set[str],
+        query_terms: Collection[str],
         levels: list[MemoryLevel] | None = None,
         strategy: RetrievalStrategy = RetrievalStrategy.HYBRID,
         limit: int = 10,
     ) -> RetrievalResult:
-        """Retrieve memory items matching query terms."""
+        """Retrieve memory items matching query terms.
+
+        A frozenset is used as given, so callers that repeat a query can build
+        it once; any other collection is interned into a new frozenset.
+        """
         start_time = datetime.now()
+        if not isinstance(query_terms, frozenset):
+            query_terms = frozenset(sys.intern(term) for term in query_terms)
 
         search_levels = levels or list(MemoryLevel)
         candidates = []
@@ -226,7 +280,7 @@ class HierarchicalMemory:
         # Collect candidates from specified levels
         for level in search_levels:
             for item in self.memory_levels[level].values():
-                relevance = item.calculate_relevance_score(query_terms)
+                relevance = item.calculate_relevance_score(query_terms, start_time)
                 if relevance > 0.1:  # Threshold for inclusion
                     candidates.append((item, relevance))
 
@@ -264,14 +318,36 @@ class HierarchicalMemory:
         )
         return result
 
+    def may_match(self, query_terms: Set[str]) -> bool:
+        """Cheap check for whether ``retrieve`` could find anything at all.
+
+        Content matching is by substring, so a term can only match if every
+        trigram of it occurs in some stored item's content. Grams are counted
+        per item and dropped on removal; content edited in place is picked up
+        when the item is stored again.
+        """
+        if not self.item_count():
+            return False
+        if not query_terms.isdisjoint(self.tag_index):
+            return True
+
+        content_grams = self.content_grams.keys()
+        for term in query_terms:
+            term = term.lower()
+            if len(term) < _GRAM_SIZE or _grams(term) <= content_grams:
+                return True
+        return False
+
+    def item_count(self) -> int:
+        """Total number of items stored across all levels."""
+        return sum(len(storage) for storage in self.memory_levels.values())
+
     def get_item(self, item_id: str) -> MemoryItem | None:
         """Get specific memory item by ID."""
-        for level_storage in self.memory_levels.values():
-            if item_id in level_storage:
-                item = level_storage[item_id]
-                item.access()
-                return item
-        return None
+        item = self._find_item(item_id)
+        if item is not None:
+            item.access()
+        return item
 
     def get_related_items(self, item_id: str, max_depth: int = 2) -> list[MemoryItem]:
         """Get items related to a specific item."""
@@ -320,6 +396,7 @@ class HierarchicalMemory:
         # Update level and store in target
         item.level = target_level
         self.memory_levels[target_level][item_id] = item
+        self._push_expiry(item)
 
         self.logger.info(
             f"Promoted item {item_id} from {source_level.value} to {target_level.value}"
@@ -327,23 +404,32 @@ class HierarchicalMemory:
         return True
 
     def cleanup_expired(self) -> dict[MemoryLevel, int]:
-        """Remove expired items from all levels."""
-        removed_counts = {}
+        """Remove expired items from all levels.
+
+        Only heap entries that have come due are popped, so the cost follows
+        the number of expired items rather than the number stored. Each popped
+        entry is checked against the item's current ``expires_at``, since its
+        level or creation time may have changed after the entry was pushed.
+        """
+        removed_counts: dict[MemoryLevel, int] = {}
+        heap = self._ttl_heap
+        now = datetime.now()
 
-        for level, storage in self.memory_levels.items():
-            expired_ids = [
-                item_id for item_id, item in storage.items() if item.is_expired()
-            ]
+        while heap and heap[0][0] < now:
+            expires_at, item_id = heapq.heappop(heap)
+            item = self._find_item(item_id)
+            if item is None:
+                continue  # Evicted or already removed
+            if item.expires_at != expires_at and item.expires_at >= now:
+                # Expiry moved later since this entry was pushed; reschedule
+                heapq.heappush(heap, (item.expires_at, item_id))
+                continue
 
-            for item_id in expired_ids:
-                del storage[item_id]
-                self._remove_from_indexes(item_id)
+            self._discard(item_id)
+            removed_counts[item.level] = removed_counts.get(item.level, 0) + 1
 
-            if expired_ids:
-                removed_counts[level] = len(expired_ids)
-                self.logger.info(
-                    f"Removed {len(expired_ids)} expired items from {level.value}"
-                )
+        for level, count in removed_counts.items():
+            self.logger.info(f"Removed {count} expired items from {level.value}")
 
         return removed_counts
 
@@ -388,6 +474,7 @@ class HierarchicalMemory:
         stats["index_sizes"] = {
             "tag_index": len(self.tag_index),
             "relationship_index": len(self.relationship_index),
+            "content_grams": len(self.content_grams),
         }
 
         return stats
@@ -399,12 +486,11 @@ class HierarchicalMemory:
 
         if len(storage) >= max_items:
             # Calculate eviction scores (lower is more likely to be evicted)
+            now = datetime.now()
             scored_items = []
             for item in storage.values():
                 # Score based on recency, frequency, and importance
-                hours_since_access = (
-                    datetime.now() - item.last_accessed
-                ).total_seconds() / 3600
+                hours_since_access = (now - item.last_accessed).total_seconds() / 3600
                 recency_score = 1.0 / (1.0 + hours_since_access)
                 frequency_score = min(item.access_count / 10.0, 1.0)
 
@@ -415,18 +501,46 @@ class HierarchicalMemory:
                 )
                 scored_items.append((item, eviction_score))
 
-            # Sort by eviction score (ascending - worst first)
-            scored_items.sort(key=lambda x: x[1])
-
-            # Evict worst 20% or enough to make room
+            # Evict worst 20% or enough to make room, without a full sort
             num_to_evict = max(1, len(storage) // 5)
-            for item, _ in scored_items[:num_to_evict]:
+            for item, _ in heapq.nsmallest(
+                num_to_evict, scored_items, key=lambda x: x[1]
+            ):
                 del storage[item.id]
                 self._remove_from_indexes(item.id)
                 self.logger.debug(
                     f"Evicted item {item.id} from {level.value} due to capacity"
                 )
 
+    def _find_item(self, item_id: str) -> MemoryItem | None:
+        """Look up an item by ID without touching its access tracking."""
+        for level_storage in self.memory_levels.values():
+            if item_id in level_storage:
+                return level_storage[item_id]
+        return None
+
+    def _discard(self, item_id: str) -> MemoryItem | None:
+        """Remove an item from whichever level holds it, and from the indexes."""
+        for level_storage in self.memory_levels.values():
+            item = level_storage.pop(item_id, None)
+            if item is not None:
+                self._remove_from_indexes(item_id)
+                return item
+        return None
+
+    def _push_expiry(self, item: MemoryItem) -> None:
+        """Schedule an item's expiry, compacting stale heap entries as needed."""
+        heapq.heappush(self._ttl_heap, (item.expires_at, item.id))
+
+        # Rebuild from live items once stale entries outnumber them
+        if len(self._ttl_heap) > 2 * self.item_count() + 64:
+            self._ttl_heap = [
+                (live.expires_at, live.id)
+                for storage in self.memory_levels.values()
+                for live in storage.values()
+            ]
+            heapq.heapify(self._ttl_heap)
+
     def _update_indexes(self, item: MemoryItem) -> None:
         """Update search indexes for an item."""
         # Tag index
@@ -439,6 +553,12 @@ class HierarchicalMemory:
         if item.related_ids:
             self.relationship_index[item.id] = item.related_ids.copy()
 
+        # Content grams, matching the serialisation relevance scoring searches;
+        # default=str keeps content json can't encode storable, as before
+        text = json.dumps(item.content, default=str).lower()
+        self._indexed_content[item.id] = text
+        self.content_grams.update(_grams(text))
+
     def _remove_from_indexes(self, item_id: str) -> None:
         """Remove item from all indexes."""
         # Remove from tag index
@@ -453,6 +573,16 @@ class HierarchicalMemory:
         # Remove from relationship index
         self.relationship_index.pop(item_id, None)
 
+        # Release the item's content grams
+        text = self._indexed_content.pop(item_id, None)
+        if text is not None:
+            content_grams = self.content_grams
+            for gram in _grams(text):
+                if content_grams[gram] == 1:
+                    del content_grams[gram]
+                else:
+                    content_grams[gram] -= 1
+
     def _sort_by_strategy(
         self, candidates: list[tuple[MemoryItem, float]], strategy: RetrievalStrategy
     ) -> list[tuple[MemoryItem, float]]:
@@ -467,12 +597,12 @@ class HierarchicalMemory:
             return sorted(candidates, key=lambda x: x[0].access_count, reverse=True)
 
         elif strategy == RetrievalStrategy.HYBRID:
+            now = datetime.now()
+
             # Combine relevance, recency, and frequency
             def hybrid_score(item_and_relevance):
                 item, relevance = item_and_relevance
-                hours_since_access = (
-                    datetime.now() - item.last_accessed
-                ).total_seconds() / 3600
+                hours_since_access = (now - item.last_accessed).total_seconds() / 3600
                 recency_score = 1.0 / (
                     1.0 + hours_since_access / 24.0
                 )  # Decay over days
@@ -488,11 +618,34 @@ class HierarchicalMemory:
 class MemoryManager:
     """Global memory manager for all agents in the system."""
 
-    def __init__(self):
+    def __init__(self, max_workers: int | None = None):
         self.agent_memories: dict[str, HierarchicalMemory] = {}
         self.shared_memory: HierarchicalMemory = HierarchicalMemory("shared")
         self.logger = logging.getLogger("memory.manager")
 
+        # Opt-in pool for cross-agent search; scoring is pure Python and holds
+        # the GIL, so threads only pay off once retrieval releases it
+        self.executor = (
+            ThreadPoolExecutor(max_workers=max_workers) if max_workers else None
+        )
+
+    def __enter__(self) -> "MemoryManager":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit; shuts down the search pool."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the cross-agent search pool, if one was started.
+
+        Searches after closing run serially on the calling thread.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
     def get_agent_memory(self, agent_id: str) -> HierarchicalMemory:
         """Get or create hierarchical memory for an agent."""
         if agent_id not in self.agent_memories:
@@ -507,36 +660,49 @@ class MemoryManager:
 
     def search_across_agents(
         self,
-        query_terms: set[str],
+        query_terms: Collection[str],
         agent_ids: list[str] | None = None,
         include_shared: bool = True,
         strategy: RetrievalStrategy = RetrievalStrategy.HYBRID,
         limit_per_agent: int = 5,
     ) -> dict[str, RetrievalResult]:
-        """Search across multiple agents' memories."""
-        results = {}
+        """Search across multiple agents' memories.
 
+        Each memory is independent, so with ``max_workers`` set the searches
+        run on the manager's thread pool.
+        """
         search_agents = agent_ids or list(self.agent_memories.keys())
-
-        # Search individual agent memories
-        for agent_id in search_agents:
-            if agent_id in self.agent_memories:
-                memory = self.agent_memories[agent_id]
-                result = memory.retrieve(
-                    query_terms, strategy=strategy, limit=limit_per_agent
-                )
-                if result.items:
-                    results[agent_id] = result
+        # Freeze once so each memory's retrieve reuses it as-is
+        query_terms = frozenset(sys.intern(term) for term in query_terms)
+
+        # Search individual agent memories, skipping ones that cannot match
+        targets = [
+            (agent_id, memory)
+            for agent_id in search_agents
+            if (memory := self.agent_memories.get(agent_id)) is not None
+            and memory.may_match(query_terms)
+        ]
 
         # Search shared memory
-        if include_shared:
-            shared_result = self.shared_memory.retrieve(
+        if include_shared and self.shared_memory.may_match(query_terms):
+            targets.append(("shared", self.shared_memory))
+
+        def search(memory: HierarchicalMemory) -> RetrievalResult:
+            return memory.retrieve(
                 query_terms, strategy=strategy, limit=limit_per_agent
             )
-            if shared_result.items:
-                results["shared"] = shared_result
 
-        return results
+        memories = [memory for _, memory in targets]
+        if self.executor is not None and len(memories) > 1:
+            retrieved = self.executor.map(search, memories)
+        else:
+            retrieved = map(search, memories)
+
+        return {
+            name: result
+            for (name, _), result in zip(targets, retrieved, strict=True)
+            if result.items
+        }
 
     def cleanup_all_memories(self) -> dict[str, dict[MemoryLevel, int]]:
         """Cleanup expired items from all agent memories."""
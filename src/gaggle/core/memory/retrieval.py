@@ -1,14 +1,40 @@
 """Intelligent context retrieval with BM25 and embedding-based search."""
 
+import heapq
 import json
 import logging
 import math
+import operator
 import re
 from abc import ABC, abstractmethod
+from array import array
 from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+# Optional SIMD similarity kernels
+try:
+    import simsimd
+
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    simsimd = None
+    SIMSIMD_AVAILABLE = False
+
+# Optional approximate nearest-neighbour index for large embedding stores
+try:
+    import faiss
+    import numpy as np
+
+    FAISS_AVAILABLE = True
+except ImportError:
+    faiss = None
+    np = None
+    FAISS_AVAILABLE = False
+
 from .hierarchical import MemoryItem
 
 
@@ -59,7 +85,13 @@ class ContextRetriever(ABC):
 
 
 class BM25Retriever(ContextRetriever):
-    """BM25-based retrieval for keyword matching."""
+    """BM25-based retrieval for keyword matching.
+
+    Term weights are scored eagerly at index time into an inverted index, so
+    a query only sums the postings of its own terms instead of re-running the
+    BM25 formula against every item. Re-indexing an unchanged item set is a
+    no-op, so callers that index before each query only pay for it once.
+    """
 
     def __init__(self, k1: float = 1.5, b: float = 0.75):
         self.k1 = k1  # Controls term frequency saturation
@@ -68,35 +100,38 @@ class BM25Retriever(ContextRetriever):
 
         # Index structures
         self.document_frequencies: dict[str, int] = {}
-        self.item_term_counts: dict[str, dict[str, int]] = {}
+        self.term_weights: dict[str, dict[str, float]] = {}  # term -> item -> weight
         self.item_lengths: dict[str, int] = {}
+        self.length_norms: dict[str, float] = {}  # item -> k1*(1-b+b*dl/avgdl)
         self.average_length: float = 0.0
         self.total_documents: int = 0
+        self._indexed_texts: dict[str, str] | None = None  # item -> indexed text
 
     def index_items(self, items: list[MemoryItem]) -> None:
         """Build BM25 index from memory items."""
+        texts = {item.id: self._extract_text(item) for item in items}
+        if texts == self._indexed_texts and self.total_documents == len(items):
+            return
         self.logger.debug(f"Indexing {len(items)} items for BM25 retrieval")
+        self._indexed_texts = texts
 
         # Reset index
         self.document_frequencies.clear()
-        self.item_term_counts.clear()
+        self.term_weights.clear()
         self.item_lengths.clear()
+        self.length_norms.clear()
 
-        # Process each item
+        # Count terms per item and document frequencies
+        item_term_counts: dict[str, Counter[str]] = {}
         total_length = 0
         for item in items:
-            # Extract text content
-            text_content = self._extract_text(item)
-            terms = self._tokenize(text_content)
-
-            # Count terms
+            terms = self._tokenize(texts[item.id])
             term_counts = Counter(terms)
-            self.item_term_counts[item.id] = dict(term_counts)
+            item_term_counts[item.id] = term_counts
             self.item_lengths[item.id] = len(terms)
             total_length += len(terms)
 
-            # Update document frequencies
-            for term in set(terms):
+            for term in term_counts:
                 self.document_frequencies[term] = (
                     self.document_frequencies.get(term, 0) + 1
                 )
@@ -104,6 +139,32 @@ class BM25Retriever(ContextRetriever):
         self.total_documents = len(items)
         self.average_length = total_length / len(items) if items else 0.0
 
+        # Score every (term, item) pair once, with loop invariants hoisted
+        idf = {
+            term: math.log((self.total_documents - df + 0.5) / (df + 0.5))
+            for term, df in self.document_frequencies.items()
+        }
+        term_weights = self.term_weights
+        for term in idf:
+            term_weights[term] = {}
+        # The query-independent half of the denominator, once per document;
+        # an all-empty corpus has no average length, so every norm is k1
+        k1, b, average_length = self.k1, self.b, self.average_length
+        self.length_norms.update(
+            (
+                item_id,
+                k1 * (1 - b + b * (length / average_length)) if average_length else k1,
+            )
+            for item_id, length in self.item_lengths.items()
+        )
+        k1_plus_1 = k1 + 1
+        for item_id, term_counts in item_term_counts.items():
+            length_norm = self.length_norms[item_id]
+            for term, tf in term_counts.items():
+                term_weights[term][item_id] = idf[term] * (
+                    tf * k1_plus_1 / (tf + length_norm)
+                )
+
         self.logger.debug(f"Indexed {len(self.document_frequencies)} unique terms")
 
     def retrieve(
@@ -114,22 +175,19 @@ class BM25Retriever(ContextRetriever):
         if not query_terms:
             return []
 
-        # Calculate BM25 scores
-        scored_items = []
-        for item in items:
-            if item.id not in self.item_term_counts:
-                continue
-
-            bm25_score = self._calculate_bm25_score(query_terms, item.id)
-
-            if bm25_score > 0:
-                relevance = RelevanceScore(total_score=0.0, bm25_score=bm25_score)
-                scored_items.append((item, relevance))
+        # Accumulate precomputed weights over each query term's postings
+        scores: dict[str, float] = {}
+        for term in query_terms:
+            for item_id, weight in self.term_weights.get(term, {}).items():
+                scores[item_id] = scores.get(item_id, 0.0) + weight
 
-        # Sort by BM25 score
-        scored_items.sort(key=lambda x: x[1].bm25_score, reverse=True)
+        scored_items = [
+            (item, RelevanceScore(total_score=0.0, bm25_score=scores[item.id]))
+            for item in items
+            if scores.get(item.id, 0.0) > 0
+        ]
 
-        return scored_items[:limit]
+        return heapq.nlargest(limit, scored_items, key=lambda x: x[1].bm25_score)
 
     def _extract_text(self, item: MemoryItem) -> str:
         """Extract searchable text from memory item."""
@@ -167,84 +225,152 @@ class BM25Retriever(ContextRetriever):
 
         return tokens
 
-    def _calculate_bm25_score(self, query_terms: list[str], item_id: str) -> float:
-        """Calculate BM25 score for an item."""
-        if item_id not in self.item_term_counts:
-            return 0.0
-
-        item_term_counts = self.item_term_counts[item_id]
-        item_length = self.item_lengths[item_id]
-
-        score = 0.0
-        for term in query_terms:
-            if term not in item_term_counts:
-                continue
-
-            # Term frequency in document
-            tf = item_term_counts[term]
-
-            # Document frequency (how many documents contain this term)
-            df = self.document_frequencies.get(term, 0)
-            if df == 0:
-                continue
-
-            # Inverse document frequency
-            idf = math.log((self.total_documents - df + 0.5) / (df + 0.5))
-
-            # BM25 formula
-            numerator = tf * (self.k1 + 1)
-            denominator = tf + self.k1 * (
-                1 - self.b + self.b * (item_length / self.average_length)
-            )
-
-            score += idf * (numerator / denominator)
-
-        return score
-
 
 class EmbeddingRetriever(ContextRetriever):
     """Embedding-based semantic retrieval (mock implementation)."""
 
-    def __init__(self, embedding_dim: int = 384):
+    def __init__(
+        self,
+        embedding_dim: int = 384,
+        ann_threshold: int = 1000,
+        quantize: bool = True,
+    ):
         self.embedding_dim = embedding_dim
+        self.ann_threshold = ann_threshold  # Index size at which FAISS takes over
+        self.quantize = quantize  # Store int8 vectors on the SimSIMD path
         self.logger = logging.getLogger("retrieval.embedding")
 
         # Mock embeddings (in production, use actual embedding model)
-        self.item_embeddings: dict[str, list[float]] = {}
+        self.item_embeddings: dict[str, Sequence[float]] = {}
+
+        # HNSW index over item_embeddings, row-aligned with _ann_ids
+        self._ann_index = None
+        self._ann_ids: list[str] = []
+        self._indexed_texts: dict[str, str] | None = None  # item -> embedded text
 
     def index_items(self, items: list[MemoryItem]) -> None:
-        """Build embedding index (mock implementation)."""
+        """Build embedding index (mock implementation).
+
+        Only items whose text changed are re-embedded, and the ANN index is
+        rebuilt only when the indexed item set differs from the last call.
+        """
+        texts = {item.id: self._extract_text(item) for item in items}
+        if texts == self._indexed_texts:
+            return
         self.logger.debug(f"Creating embeddings for {len(items)} items")
 
-        for item in items:
-            # Mock embedding generation based on text content
-            text_content = self._extract_text(item)
-            embedding = self._create_mock_embedding(text_content)
-            self.item_embeddings[item.id] = embedding
+        previous_texts = self._indexed_texts or {}
+        previous_embeddings = self.item_embeddings
+        self.item_embeddings = {}
+        for item_id, text_content in texts.items():
+            if previous_texts.get(item_id) == text_content:
+                self.item_embeddings[item_id] = previous_embeddings[item_id]
+            else:
+                # Mock embedding generation based on text content
+                embedding = self._create_mock_embedding(text_content)
+                self.item_embeddings[item_id] = self._as_vector(embedding)
+        self._indexed_texts = texts
+
+        self._build_ann_index()
 
     def retrieve(
         self, query: str, items: list[MemoryItem], limit: int = 10
     ) -> list[tuple[MemoryItem, RelevanceScore]]:
         """Retrieve items using semantic similarity."""
-        query_embedding = self._create_mock_embedding(query)
+        query_embedding = self._as_vector(self._create_mock_embedding(query))
+        if self._ann_index is not None:
+            return self._retrieve_ann(query_embedding, items, limit)
 
         scored_items = []
         for item in items:
-            if item.id not in self.item_embeddings:
+            embedding = self.item_embeddings.get(item.id)
+            if embedding is None:
                 continue
 
-            similarity = self._cosine_similarity(
-                query_embedding, self.item_embeddings[item.id]
-            )
+            similarity = self._similarity(query_embedding, embedding)
 
             if similarity > 0.1:  # Threshold for inclusion
                 relevance = RelevanceScore(total_score=0.0, semantic_score=similarity)
                 scored_items.append((item, relevance))
 
-        # Sort by similarity
-        scored_items.sort(key=lambda x: x[1].semantic_score, reverse=True)
+        return heapq.nlargest(limit, scored_items, key=lambda x: x[1].semantic_score)
 
-        return scored_items[:limit]
+    def _build_ann_index(self) -> None:
+        """Rebuild the FAISS HNSW index once the store is large enough."""
+        self._ann_index = None
+        if not FAISS_AVAILABLE or len(self.item_embeddings) < self.ann_threshold:
+            return
+
+        self._ann_ids = list(self.item_embeddings)
+        matrix = self._unit_rows(
+            [self.item_embeddings[item_id] for item_id in self._ann_ids]
+        )
+        # Rows are unit vectors, so inner product is cosine similarity
+        index = faiss.IndexHNSWFlat(self.embedding_dim, 32, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = 200
+        index.add(matrix)
+        self._ann_index = index
+
+    def _retrieve_ann(
+        self, query_embedding: Sequence[float], items: list[MemoryItem], limit: int
+    ) -> list[tuple[MemoryItem, RelevanceScore]]:
+        """Retrieve the nearest items from the FAISS index."""
+        item_map = {item.id: item for item in items if item.id in self.item_embeddings}
+        if not item_map:
+            return []
+
+        # Over-fetch by the number of indexed items outside this candidate set
+        total = len(self._ann_ids)
+        k = min(total, limit + total - len(item_map))
+        query_matrix = self._unit_rows([query_embedding])
+        similarities, rows = self._ann_index.search(query_matrix, k)
+
+        scored_items = []
+        for similarity, row in zip(similarities[0], rows[0], strict=True):
+            if row < 0 or similarity <= 0.1:
+                continue
+            item = item_map.get(self._ann_ids[row])
+            if item is None:
+                continue
+            relevance = RelevanceScore(
+                total_score=0.0, semantic_score=float(similarity)
+            )
+            scored_items.append((item, relevance))
+            if len(scored_items) == limit:
+                break
+
+        return scored_items
+
+    @staticmethod
+    def _unit_rows(vectors: list[Sequence[float]]):
+        """Stack vectors as float32 rows rescaled to unit length for FAISS."""
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+
+    def _as_vector(self, embedding: list[float]) -> Sequence[float]:
+        """Pack an embedding into a contiguous buffer when SimSIMD is present.
+
+        With ``quantize`` each vector is scaled symmetrically into int8, a
+        quarter of the float32 footprint; cosine is scale-invariant, so the
+        per-vector scale never needs to be stored.
+        """
+        if not SIMSIMD_AVAILABLE:
+            return embedding
+        if not self.quantize:
+            return array("f", embedding)
+
+        scale = max(map(abs, embedding)) or 1.0
+        return array("b", (round(x * 127 / scale) for x in embedding))
+
+    @staticmethod
+    def _similarity(a: Sequence[float], b: Sequence[float]) -> float:
+        """Cosine similarity between two embeddings (unit length if unpacked)."""
+        if SIMSIMD_AVAILABLE:
+            return 1.0 - float(simsimd.cosine(a, b))
+
+        # Unit vectors, so cosine is a plain dot product; map keeps it in C
+        return sum(map(operator.mul, a, b))
 
     def _extract_text(self, item: MemoryItem) -> str:
         """Extract text content for embedding."""
@@ -279,20 +405,6 @@ class EmbeddingRetriever(ContextRetriever):
 
         return embedding
 
-    def _cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        if len(vec1) != len(vec2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(vec1, vec2, strict=False))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot_product / (norm1 * norm2)
-
 
 class HybridRetriever(ContextRetriever):
     """Hybrid retrieval combining BM25 and embedding approaches."""
@@ -361,6 +473,13 @@ class HybridRetriever(ContextRetriever):
         return scored_items[:limit]
 
 
+@lru_cache(maxsize=4096)
+def _frequency_score(access_count: int) -> float:
+    """Log-scaled access frequency in [0, 1], memoised per access count."""
+    # Logarithmic scaling to prevent dominance of very frequent items
+    return min(math.log(1 + access_count) / math.log(11), 1.0)
+
+
 class RelevanceScorer:
     """Advanced relevance scoring with multiple factors."""
 
@@ -368,13 +487,20 @@ class RelevanceScorer:
         self.logger = logging.getLogger("retrieval.scorer")
 
     def score_item(
-        self, item: MemoryItem, query_terms: set[str], base_score: float = 0.0
+        self,
+        item: MemoryItem,
+        query_terms: set[str],
+        base_score: float = 0.0,
+        now: datetime | None = None,
     ) -> RelevanceScore:
-        """Calculate comprehensive relevance score for an item."""
+        """Calculate comprehensive relevance score for an item.
+
+        Batch callers pass ``now`` so the clock is read once per ranking.
+        """
         score = RelevanceScore(total_score=base_score, bm25_score=base_score)
 
         # Temporal scoring (recency)
-        score.temporal_score = self._calculate_temporal_score(item)
+        score.temporal_score = self._calculate_temporal_score(item, now)
 
         # Frequency scoring (access patterns)
         score.frequency_score = self._calculate_frequency_score(item)
@@ -387,11 +513,11 @@ class RelevanceScorer:
 
         return score
 
-    def _calculate_temporal_score(self, item: MemoryItem) -> float:
+    def _calculate_temporal_score(
+        self, item: MemoryItem, now: datetime | None = None
+    ) -> float:
         """Calculate temporal relevance based on recency."""
-        from datetime import datetime
-
-        now = datetime.now()
+        now = now or datetime.now()
         hours_since_access = (now - item.last_accessed).total_seconds() / 3600
         hours_since_creation = (now - item.created_at).total_seconds() / 3600
 
@@ -404,11 +530,7 @@ class RelevanceScorer:
 
     def _calculate_frequency_score(self, item: MemoryItem) -> float:
         """Calculate frequency-based relevance."""
-        # Logarithmic scaling to prevent dominance of very frequent items
-        frequency_score = math.log(1 + item.access_count) / math.log(
-            11
-        )  # Scale to [0, 1] range
-        return min(frequency_score, 1.0)
+        return _frequency_score(item.access_count)
 
     def rank_items(
         self,
@@ -417,9 +539,10 @@ class RelevanceScorer:
     ) -> list[tuple[MemoryItem, RelevanceScore]]:
         """Re-rank items using comprehensive scoring."""
         enhanced_scores = []
+        now = datetime.now()
 
         for item, score in items_and_scores:
-            enhanced_score = self.score_item(item, query_terms, score.total_score)
+            enhanced_score = self.score_item(item, query_terms, score.total_score, now)
             # Keep the original retrieval scores and add temporal/frequency
             enhanced_score.bm25_score = score.bm25_score
             enhanced_score.semantic_score = score.semantic_score
@@ -466,8 +589,6 @@ class AdvancedRetriever:
         fallback_strategies: list[str] | None = None,
     ) -> list[tuple[MemoryItem, RelevanceScore]]:
         """Retrieve with fallback to alternative strategies."""
-        from datetime import datetime
-
         start_time = datetime.now()
         query_terms = set(query.lower().split())
 
@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
+import operator
 from collections import defaultdict, deque
+from collections.abc import Coroutine, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -106,6 +108,33 @@ class MetricThreshold:
 
         return AlertSeverity.INFO
 
+    def evaluate_many(self, values: Iterable[float]) -> list[AlertSeverity]:
+        """Evaluate the threshold against a series of values at once.
+
+        Matches ``evaluate`` per value, with the direction check and threshold
+        lookups done once for the whole series.
+        """
+        if self.threshold_direction == "above":
+            compare = operator.ge
+        elif self.threshold_direction == "below":
+            compare = operator.le
+        else:
+            return [AlertSeverity.INFO for _ in values]
+
+        critical = self.critical_threshold
+        error = self.error_threshold
+        warning = self.warning_threshold
+        return [
+            AlertSeverity.CRITICAL
+            if compare(value, critical)
+            else AlertSeverity.ERROR
+            if compare(value, error)
+            else AlertSeverity.WARNING
+            if compare(value, warning)
+            else AlertSeverity.INFO
+            for value in values
+        ]
+
 
 @dataclass
 class Alert:
@@ -224,6 +253,9 @@ class SprintHealthMonitor:
         # Dashboards
         self.dashboards: dict[str, Dashboard] = {}
 
+        # In-flight alert evaluations, held so they are not garbage-collected
+        self._evaluation_tasks: set[asyncio.Task] = set()
+
         # Configuration
         self._configure_default_thresholds()
         self._configure_default_rules()
@@ -369,10 +401,41 @@ class SprintHealthMonitor:
         self.metrics[metric.metric_type].append(metric)
 
         # Evaluate alerts
-        asyncio.create_task(self._evaluate_alerts(metric))
+        self._schedule_evaluation(self._evaluate_alerts(metric))
 
         logger.debug(f"Recorded metric: {metric.name} = {metric.value} {metric.unit}")
 
+    def record_metrics(self, metrics: list[HealthMetric]) -> None:
+        """Record a batch of health metrics, evaluating alerts in one task."""
+        for metric in metrics:
+            self.metrics[metric.metric_type].append(metric)
+
+        if metrics:
+            self._schedule_evaluation(self._evaluate_alerts_batch(metrics))
+
+        logger.debug(f"Recorded {len(metrics)} metrics")
+
+    def _schedule_evaluation(self, evaluation: Coroutine[Any, Any, None]) -> None:
+        """Run an alert evaluation in the background, or now if no loop is running.
+
+        Scheduled tasks are kept in ``_evaluation_tasks`` until they finish,
+        since the event loop only holds weak references to them.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(evaluation)
+            return
+
+        task = loop.create_task(evaluation)
+        self._evaluation_tasks.add(task)
+        task.add_done_callback(self._evaluation_tasks.discard)
+
+    async def _evaluate_alerts_batch(self, metrics: list[HealthMetric]) -> None:
+        """Evaluate alert rules against each metric of a batch in turn."""
+        for metric in metrics:
+            await self._evaluate_alerts(metric)
+
     async def _evaluate_alerts(self, metric: HealthMetric) -> None:
         """Evaluate alert rules against new metric."""
         for rule in self.alert_rules.values():
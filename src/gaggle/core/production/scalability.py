@@ -71,7 +71,7 @@ class ResourceLimit:
         return utilization <= self.scale_down_threshold
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentInstance:
     """Individual agent instance for scaling."""
 
@@ -95,6 +95,21 @@ class AgentInstance:
     memory_mb: float = 0.0
     cpu_percent: float = 0.0
 
+    @classmethod
+    def bulk(
+        cls,
+        role: AgentRole,
+        count: int,
+        max_concurrent_tasks: int = 3,
+        id_prefix: str | None = None,
+    ) -> list["AgentInstance"]:
+        """Create ``count`` instances of a role with IDs ``<prefix>_<n>``."""
+        prefix = id_prefix or role.value
+        return [
+            cls(f"{prefix}_{i}", role, max_concurrent_tasks=max_concurrent_tasks)
+            for i in range(count)
+        ]
+
     def available_capacity(self) -> int:
         """Get available task capacity."""
         return max(0, self.max_concurrent_tasks - self.current_task_count)
@@ -227,17 +242,12 @@ class ResourceManager:
         self, role: AgentRole, count: int
     ) -> list[AgentInstance]:
         """Create new agent instances."""
-        instances = []
-
-        for i in range(count):
-            instance = AgentInstance(
-                instance_id=f"{role.value}_{datetime.now().isoformat()}_{i}",
-                agent_role=role,
-                max_concurrent_tasks=self._get_default_capacity(role),
-            )
-            instances.append(instance)
-
-        return instances
+        return AgentInstance.bulk(
+            role,
+            count,
+            max_concurrent_tasks=self._get_default_capacity(role),
+            id_prefix=f"{role.value}_{datetime.now().isoformat()}",
+        )
 
     def _get_default_capacity(self, role: AgentRole) -> int:
         """Get default task capacity for agent role."""
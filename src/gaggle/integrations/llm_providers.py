@@ -54,6 +54,31 @@ class BaseLLMProvider(ABC):
         """Generate response from LLM."""
         pass
 
+    @staticmethod
+    def _system_blocks(system_prompt: str) -> list[dict[str, Any]]:
+        """Wrap a system prompt as content blocks, marked for prompt caching.
+
+        Agents send the same instruction on every call, so an ephemeral
+        cache breakpoint lets repeat calls read the prefix from cache.
+        """
+        block: dict[str, Any] = {"type": "text", "text": system_prompt}
+        if settings.prompt_caching_enabled:
+            block["cache_control"] = {"type": "ephemeral"}
+        return [block]
+
+    @staticmethod
+    def _usage_summary(usage: dict[str, Any]) -> dict[str, int]:
+        """Normalize a Claude usage payload, including prompt-cache counters."""
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "cache_creation_input_tokens": usage.get("cache_creation_input_tokens", 0),
+            "cache_read_input_tokens": usage.get("cache_read_input_tokens", 0),
+        }
+
     @abstractmethod
     async def generate_streaming_response(
         self, prompt: str, system_prompt: str | None = None, **kwargs
@@ -139,10 +164,7 @@ class AnthropicProvider(BaseLLMProvider):
         await self._check_rate_limit()
 
         # Prepare request
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = [{"role": "user", "content": prompt}]
 
         request_data = {
             "model": self.config.model_id,
@@ -151,6 +173,8 @@ class AnthropicProvider(BaseLLMProvider):
             "temperature": self.config.temperature,
             **kwargs,
         }
+        if system_prompt:
+            request_data["system"] = self._system_blocks(system_prompt)
 
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -173,26 +197,21 @@ class AnthropicProvider(BaseLLMProvider):
                     response_text = content[0].get("text", "")
 
                 # Track token usage
-                usage = result.get("usage", {})
-                input_tokens = usage.get("input_tokens", 0)
-                output_tokens = usage.get("output_tokens", 0)
-                self._update_token_usage(input_tokens, output_tokens)
+                usage = self._usage_summary(result.get("usage", {}))
+                self._update_token_usage(usage["input_tokens"], usage["output_tokens"])
 
                 self.logger.info(
                     "anthropic_request_success",
                     model=self.config.model_id,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
+                    input_tokens=usage["input_tokens"],
+                    output_tokens=usage["output_tokens"],
+                    cache_read_tokens=usage["cache_read_input_tokens"],
                 )
 
                 return {
                     "response": response_text,
                     "model": self.config.model_id,
-                    "usage": {
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                        "total_tokens": input_tokens + output_tokens,
-                    },
+                    "usage": usage,
                     "finish_reason": result.get("stop_reason"),
                     "timestamp": datetime.now().isoformat(),
                 }
@@ -211,10 +230,7 @@ class AnthropicProvider(BaseLLMProvider):
         await self._check_rate_limit()
 
         # Prepare request
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = [{"role": "user", "content": prompt}]
 
         request_data = {
             "model": self.config.model_id,
@@ -224,6 +240,8 @@ class AnthropicProvider(BaseLLMProvider):
             "stream": True,
             **kwargs,
         }
+        if system_prompt:
+            request_data["system"] = self._system_blocks(system_prompt)
 
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -301,7 +319,7 @@ class AWSBedrockProvider(BaseLLMProvider):
         }
 
         if system_prompt:
-            body["system"] = system_prompt
+            body["system"] = self._system_blocks(system_prompt)
 
         body["messages"].append({"role": "user", "content": prompt})
 
@@ -322,26 +340,21 @@ class AWSBedrockProvider(BaseLLMProvider):
                 response_text = content[0].get("text", "")
 
             # Track token usage
-            usage = result.get("usage", {})
-            input_tokens = usage.get("input_tokens", 0)
-            output_tokens = usage.get("output_tokens", 0)
-            self._update_token_usage(input_tokens, output_tokens)
+            usage = self._usage_summary(result.get("usage", {}))
+            self._update_token_usage(usage["input_tokens"], usage["output_tokens"])
 
             self.logger.info(
                 "bedrock_request_success",
                 model=self.config.model_id,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
+                input_tokens=usage["input_tokens"],
+                output_tokens=usage["output_tokens"],
+                cache_read_tokens=usage["cache_read_input_tokens"],
             )
 
             return {
                 "response": response_text,
                 "model": self.config.model_id,
-                "usage": {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": input_tokens + output_tokens,
-                },
+                "usage": usage,
                 "finish_reason": result.get("stop_reason"),
                 "timestamp": datetime.now().isoformat(),
             }
@@ -103,19 +103,21 @@ class SprintModel(BaseModel):
     @classmethod
     def validate_id(cls, v):
         """Validate sprint ID is not empty."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Sprint ID cannot be empty')
-        return v.strip()
+        return v
 
     @field_validator('goal')
     @classmethod
     def validate_goal(cls, v):
         """Validate sprint goal."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Sprint goal cannot be empty')
-        if len(v.strip()) < 10:
+        if len(v) < 10:
             raise ValueError('Sprint goal must be at least 10 characters')
-        return v.strip()
+        return v
 
     @field_validator('end_date')
     @classmethod
@@ -85,29 +85,32 @@ class UserStory(BaseModel):
     @classmethod
     def validate_id(cls, v):
         """Validate story ID is not empty."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Story ID cannot be empty')
-        return v.strip()
+        return v
 
     @field_validator('title')
     @classmethod
     def validate_title(cls, v):
         """Validate story title."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Story title cannot be empty')
-        if len(v.strip()) > 200:
+        if len(v) > 200:
             raise ValueError('Story title must be 200 characters or less')
-        return v.strip()
+        return v
 
     @field_validator('description')
     @classmethod
     def validate_description(cls, v):
         """Validate story description."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Story description cannot be empty')
-        if len(v.strip()) < 10:
+        if len(v) < 10:
             raise ValueError('Story description must be at least 10 characters')
-        return v.strip()
+        return v
 
     @field_validator('story_points')
     @classmethod
@@ -127,29 +127,32 @@ class Task(BaseModel):
     @classmethod
     def validate_id(cls, v):
         """Validate task ID is not empty."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Task ID cannot be empty')
-        return v.strip()
+        return v
 
     @field_validator('title')
     @classmethod
     def validate_title(cls, v):
         """Validate task title."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Task title cannot be empty')
-        if len(v.strip()) > 200:
+        if len(v) > 200:
             raise ValueError('Task title must be 200 characters or less')
-        return v.strip()
+        return v
 
     @field_validator('description')
     @classmethod
     def validate_description(cls, v):
         """Validate task description."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Task description cannot be empty')
-        if len(v.strip()) < 10:
+        if len(v) < 10:
             raise ValueError('Task description must be at least 10 characters')
-        return v.strip()
+        return v
 
     @field_validator('progress_percentage')
     @classmethod
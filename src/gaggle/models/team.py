@@ -51,17 +51,19 @@ class TeamMember(BaseModel):
     @classmethod
     def validate_id(cls, v):
         """Validate team member ID is not empty."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Team member ID cannot be empty')
-        return v.strip()
+        return v
 
     @field_validator('name')
     @classmethod
     def validate_name(cls, v):
         """Validate team member name is not empty."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Team member name cannot be empty')
-        return v.strip()
+        return v
 
     def assign_task(self, task_id: str) -> None:
         """Assign a task to this team member."""
@@ -23,6 +23,9 @@ class TokenCounter:
     def __init__(self):
         self.usage_records: list[TokenUsage] = []
         self._totals_by_role: dict[AgentRole, tuple[int, int, float]] = {}
+        # Grand totals kept alongside the per-role ones so reads are O(1)
+        self._total_tokens = 0
+        self._total_cost = 0.0
 
     def add_usage(self, input_tokens: int, output_tokens: int, role: AgentRole) -> None:
         """Add token usage for an agent role."""
@@ -45,17 +48,16 @@ class TokenCounter:
             current[1] + output_tokens,
             current[2] + cost,
         )
+        self._total_tokens += input_tokens + output_tokens
+        self._total_cost += cost
 
     def get_total_tokens(self) -> int:
         """Get total tokens used across all agents."""
-        return sum(
-            input_tokens + output_tokens
-            for input_tokens, output_tokens, _ in self._totals_by_role.values()
-        )
+        return self._total_tokens
 
     def get_total_cost(self) -> float:
         """Get total cost across all agents."""
-        return sum(cost for _, _, cost in self._totals_by_role.values())
+        return self._total_cost
 
     def get_usage_by_role(self, role: AgentRole) -> tuple[int, int, float]:
         """Get usage totals for a specific role."""
@@ -95,6 +97,8 @@ class TokenCounter:
         """Reset all usage tracking."""
         self.usage_records.clear()
         self._totals_by_role.clear()
+        self._total_tokens = 0
+        self._total_cost = 0.0
 
     def export_usage_data(self) -> list[dict[str, any]]:
         """Export usage data for analysis."""
@@ -4,149 +4,150 @@ Simple coverage improvement test suite - focus on basic imports and instantiatio
 """
 
 
+import asyncio
+import importlib
+
 import pytest
 
+from gaggle.agents.base import BaseAgent
+from gaggle.agents.coordination.product_owner import ProductOwner
+from gaggle.agents.coordination.scrum_master import ScrumMaster
+from gaggle.agents.implementation.backend_dev import BackendDeveloper
+from gaggle.agents.implementation.frontend_dev import FrontendDeveloper
+from gaggle.core.communication.protocols import CommunicationProtocol
+from gaggle.core.memory.caching import PromptCache
+from gaggle.core.memory.hierarchical import HierarchicalMemory
+from gaggle.core.state.context import AgentContext
+from gaggle.core.state.machines import AgentStateMachine
+from gaggle.utils.async_utils import gather_with_concurrency, run_with_timeout
+from gaggle.utils.logging import get_logger
+from gaggle.workflows import daily_standup, sprint_execution
+
+
+def _assert_attrs(modname, *attrs):
+    """Assert that each named attribute of a module is present and not None."""
+    module = importlib.import_module(modname)
+    for attr in attrs:
+        assert getattr(module, attr) is not None
+
+
+# Module import coverage
+@pytest.mark.parametrize(
+    "modpath,attr",
+    [
+        ("gaggle.utils.cost_calculator", "CostCalculator"),
+        ("gaggle.utils.token_counter", "TokenCounter"),
+        ("gaggle.utils.logging", "get_logger"),
+        ("gaggle.utils.async_utils", "run_with_timeout"),
+        ("gaggle.core.communication.bus", "MessageBus"),
+        ("gaggle.core.communication.messages", "AgentMessage"),
+        ("gaggle.core.communication.protocols", "ProtocolValidator"),
+        ("gaggle.tools.code_tools", "CodeAnalysisTool"),
+        ("gaggle.tools.github_tools", "GitHubTool"),
+        ("gaggle.tools.project_tools", "BacklogTool"),
+        ("gaggle.tools.review_tools", "CodeReviewTool"),
+        ("gaggle.tools.testing_tools", "TestingTool"),
+        ("gaggle.core.memory.caching", "PromptCache"),
+        ("gaggle.core.memory.compression", "HierarchicalCompressor"),
+        ("gaggle.core.memory.hierarchical", "HierarchicalMemory"),
+        ("gaggle.core.memory.retrieval", "AdvancedRetriever"),
+        ("gaggle.core.state.context", "ContextManager"),
+        ("gaggle.core.state.machines", "AgentStateMachine"),
+        ("gaggle.workflows.daily_standup", "DailyStandupWorkflow"),
+        ("gaggle.workflows.sprint_execution", "SprintExecutionWorkflow"),
+        ("gaggle.agents.base", "BaseAgent"),
+        ("gaggle.agents.architecture", "TechLead"),
+        ("gaggle.agents.coordination", "ProductOwner"),
+        ("gaggle.agents.implementation", "BackendDeveloper"),
+        ("gaggle.agents.qa", "QAEngineer"),
+    ],
+)
+def test_import(modpath, attr):
+    """Test each gaggle module imports and exposes its main entry point."""
+    _assert_attrs(modpath, attr)
 
-# Utils coverage
-def test_utils_imports():
-    """Test that all utils modules can be imported."""
-    from gaggle.utils import async_utils, cost_calculator, logging, token_counter
-    assert cost_calculator is not None
-    assert token_counter is not None
-    assert logging is not None
-    assert async_utils is not None
-
-def test_cost_calculator_import():
-    """Test cost calculator classes."""
-    from gaggle.utils.cost_calculator import (
-        CostCalculator,
-    )
-    calculator = CostCalculator()
-    assert calculator is not None
-
-def test_token_counter_import():
-    """Test token counter classes."""
-    from gaggle.utils.token_counter import TokenCounter
-    counter = TokenCounter()
-    assert counter is not None
 
+# Utils coverage
 def test_logging_import():
     """Test logging utilities."""
-    from gaggle.utils.logging import get_logger
     logger = get_logger("test")
     assert logger is not None
 
-@pytest.mark.asyncio
-async def test_async_utils_import():
+def test_async_utils_import():
     """Test async utilities."""
-    from gaggle.utils.async_utils import (
-        run_with_timeout,
-    )
-
-    # Simple async test
+    # Trivial coroutines run on a bare loop, without the pytest-asyncio fixtures
     async def dummy():
         return "test"
 
-    result = await run_with_timeout(dummy(), 1.0, "default")
-    assert result == "test"
+    assert asyncio.run(run_with_timeout(dummy(), 1.0, "default")) == "test"
 
+def test_gather_with_concurrency():
+    """Test bounded gather returns every result in order."""
+    async def done(i):
+        return f"completed {i}"
+
+    results = asyncio.run(
+        gather_with_concurrency([done(0), done(1)], max_concurrency=2)
+    )
+    assert results == ["completed 0", "completed 1"]
 
-# Communication coverage
-def test_communication_imports():
-    """Test communication module imports."""
-    from gaggle.core.communication import bus, messages, protocols
-    assert bus is not None
-    assert messages is not None
-    assert protocols is not None
 
+# Communication coverage
 def test_message_classes():
     """Test message classes can be imported."""
-    from gaggle.core.communication.messages import (
-        AgentMessage,
-        MessagePriority,
-        MessageType,
-        TaskAssignmentMessage,
+    _assert_attrs(
+        "gaggle.core.communication.messages",
+        "AgentMessage",
+        "TaskAssignmentMessage",
+        "MessageType",
+        "MessagePriority",
     )
-    assert AgentMessage is not None
-    assert TaskAssignmentMessage is not None
-    assert MessageType is not None
-    assert MessagePriority is not None
 
-def test_bus_classes():
+@pytest.fixture(scope="module")
+def comm_primitives(message_bus):
+    """Expose the session bus with the router and validator it owns."""
+    return {
+        "bus": message_bus,
+        "router": message_bus.router,
+        "validator": message_bus.validator,
+    }
+
+def test_bus_classes(comm_primitives):
     """Test bus classes can be imported."""
-    from gaggle.core.communication.bus import MessageBus
-    bus = MessageBus()
-    assert bus is not None
+    assert comm_primitives["bus"] is not None
+    assert comm_primitives["router"].routing_rules
+    assert comm_primitives["validator"] is not None
 
 def test_protocol_classes():
     """Test protocol classes can be imported."""
-    from gaggle.core.communication.protocols import (
-        CommunicationProtocol,
-    )
     protocol = CommunicationProtocol()
     assert protocol is not None
 
 
 # Tools coverage
-def test_tools_imports():
-    """Test tools module imports."""
-    from gaggle.tools import (
-        code_tools,
-        github_tools,
-        project_tools,
-        review_tools,
-        testing_tools,
-    )
-    assert code_tools is not None
-    assert github_tools is not None
-    assert project_tools is not None
-    assert review_tools is not None
-    assert testing_tools is not None
-
-def test_project_tools_classes():
-    """Test project tools classes."""
-    from gaggle.tools.project_tools import BacklogTool
-    backlog = BacklogTool()
-    assert backlog is not None
-
-def test_code_tools_classes():
-    """Test code tools classes."""
-    from gaggle.tools.code_tools import CodeAnalysisTool
-    analyzer = CodeAnalysisTool()
-    assert analyzer is not None
-
-def test_github_tools_classes():
-    """Test GitHub tools classes."""
-    from gaggle.tools.github_tools import GitHubTool
-    github = GitHubTool()
-    assert github is not None
-
-def test_review_tools_classes():
-    """Test review tools classes."""
-    from gaggle.tools.review_tools import CodeReviewTool
-    review = CodeReviewTool()
-    assert review is not None
-
-def test_testing_tools_classes():
-    """Test testing tools classes."""
-    from gaggle.tools.testing_tools import TestingTool
-    testing = TestingTool()
-    assert testing is not None
+@pytest.mark.parametrize(
+    "module_path,class_name",
+    [
+        ("gaggle.tools.project_tools", "BacklogTool"),
+        ("gaggle.tools.project_tools", "MetricsTool"),
+        ("gaggle.tools.code_tools", "CodeAnalysisTool"),
+        ("gaggle.tools.code_tools", "CodeGenerationTool"),
+        ("gaggle.tools.github_tools", "GitHubTool"),
+        ("gaggle.tools.review_tools", "CodeReviewTool"),
+        ("gaggle.tools.testing_tools", "TestingTool"),
+        ("gaggle.tools.testing_tools", "TestPlanTool"),
+    ],
+)
+def test_tool_classes(module_path, class_name):
+    """Test each tool instantiates with a name and an execute entry point."""
+    tool = getattr(importlib.import_module(module_path), class_name)()
+    assert tool.name
+    assert callable(tool.execute)
 
 
 # Memory modules coverage
-def test_memory_imports():
-    """Test memory module imports."""
-    from gaggle.core.memory import caching, compression, hierarchical, retrieval
-    assert caching is not None
-    assert compression is not None
-    assert hierarchical is not None
-    assert retrieval is not None
-
 def test_memory_classes():
     """Test memory classes can be imported."""
-    from gaggle.core.memory.caching import PromptCache
-    from gaggle.core.memory.hierarchical import HierarchicalMemory
     cache = PromptCache()
     memory = HierarchicalMemory()
     assert cache is not None
@@ -154,57 +155,29 @@ def test_memory_classes():
 
 
 # State and workflow coverage
-def test_state_imports():
-    """Test state module imports."""
-    from gaggle.core.state import context, machines
-    assert context is not None
-    assert machines is not None
-
 def test_state_classes():
     """Test state classes can be imported."""
-    from gaggle.core.state.context import AgentContext
-    from gaggle.core.state.machines import AgentStateMachine
     context_obj = AgentContext()
     machine = AgentStateMachine()
     assert context_obj is not None
     assert machine is not None
 
-def test_workflow_imports():
-    """Test workflow module imports."""
-    from gaggle.workflows import daily_standup, sprint_execution
-    assert daily_standup is not None
-    assert sprint_execution is not None
-
 def test_workflow_classes():
     """Test workflow classes can be imported."""
-    from gaggle.workflows.daily_standup import StandupManager
-    from gaggle.workflows.sprint_execution import SprintExecutor
-    standup = StandupManager()
-    executor = SprintExecutor()
+    standup = daily_standup.StandupManager()
+    executor = sprint_execution.SprintExecutor()
     assert standup is not None
     assert executor is not None
 
 
 # Agent coverage
-def test_agent_imports():
-    """Test agent module imports."""
-    from gaggle.agents import architecture, base, coordination, implementation, qa
-    assert base is not None
-    assert architecture is not None
-    assert coordination is not None
-    assert implementation is not None
-    assert qa is not None
-
 def test_base_agent_classes():
     """Test base agent classes."""
-    from gaggle.agents.base import BaseAgent
     agent = BaseAgent()
     assert agent is not None
 
 def test_implementation_agent_classes():
     """Test implementation agent classes."""
-    from gaggle.agents.implementation.backend_dev import BackendDeveloper
-    from gaggle.agents.implementation.frontend_dev import FrontendDeveloper
     backend = BackendDeveloper()
     frontend = FrontendDeveloper()
     assert backend is not None
@@ -212,13 +185,7 @@ def test_implementation_agent_classes():
 
 def test_coordination_agent_classes():
     """Test coordination agent classes."""
-    from gaggle.agents.coordination.product_owner import ProductOwner
-    from gaggle.agents.coordination.scrum_master import ScrumMaster
     po = ProductOwner()
     sm = ScrumMaster()
     assert po is not None
     assert sm is not None
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
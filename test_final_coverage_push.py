@@ -3,220 +3,182 @@
 Final coverage push test suite - targeting main.py and integration_tools.py.
 """
 
-import os
-import tempfile
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 import pytest
 
+from gaggle.config.models import AgentRole
+from gaggle.tools import integration_tools
+from gaggle.tools.project_tools import BaseTool
+from gaggle.utils.async_utils import ParallelExecutor
+from gaggle.utils.cost_calculator import AgentAllocation, TaskEstimate
+from gaggle.utils.logging import LoggerMixin
+
+main = pytest.importorskip("gaggle.main")
+
+
+def _recorder(result=None):
+    """Return a stand-in callable that records its calls on ``.calls``."""
+    calls = []
+
+    def record(*args, **kwargs):
+        calls.append((args, kwargs))
+        return result
+
+    record.calls = calls
+    return record
+
+
+@pytest.fixture
+def patched_echo(monkeypatch):
+    """Replace typer.echo for the duration of a test and return the recorder."""
+    echo = _recorder()
+    monkeypatch.setattr(main.typer, "echo", echo)
+    return echo
+
+
+@pytest.fixture(scope="session")
+def metrics_json(tmp_path_factory):
+    """Write one metrics JSON file for the session and return its path."""
+    p = tmp_path_factory.mktemp("metrics") / "m.json"
+    p.write_text('{"test": "data"}')
+    return str(p)
+
 
 # Test main.py CLI functionality
 def test_main_imports():
     """Test main module can be imported."""
-    from gaggle import main
     assert main is not None
 
-@patch('gaggle.main.typer.run')
-def test_main_cli_structure(mock_run):
+def test_main_cli_structure():
     """Test CLI structure exists."""
-    from gaggle.main import analyze_metrics, app, create_team, run_sprint
-    assert app is not None
-    assert create_team is not None
-    assert run_sprint is not None
-    assert analyze_metrics is not None
-
-@patch('gaggle.main.TeamConfiguration')
-@patch('gaggle.main.typer.echo')
-def test_create_team_command(mock_echo, mock_team_config):
-    """Test create team command."""
-    from gaggle.main import create_team
+    assert main.app is not None
+    assert main.create_team is not None
+    assert main.run_sprint is not None
+    assert main.analyze_metrics is not None
 
+def test_create_team_command(monkeypatch, patched_echo):
+    """Test create team command."""
     # Mock the team configuration
-    mock_team = Mock()
-    mock_team_config.return_value = mock_team
+    mock_team_config = _recorder(SimpleNamespace())
+    monkeypatch.setattr(main, "TeamConfiguration", mock_team_config)
 
     # Call the function
-    create_team("test_team", 4)
+    main.create_team("test_team", 4)
 
     # Verify it was called
-    mock_team_config.assert_called()
-    mock_echo.assert_called()
+    assert mock_team_config.calls
+    assert patched_echo.calls
 
-@patch('gaggle.main.SprintModel')
-@patch('gaggle.main.typer.echo')
-def test_run_sprint_command(mock_echo, mock_sprint):
+def test_run_sprint_command(monkeypatch, patched_echo):
     """Test run sprint command."""
-    from gaggle.main import run_sprint
-
     # Mock sprint
-    mock_sprint_obj = Mock()
-    mock_sprint.return_value = mock_sprint_obj
+    mock_sprint = _recorder(SimpleNamespace())
+    monkeypatch.setattr(main, "SprintModel", mock_sprint)
 
     # Call the function
-    run_sprint("test_sprint", "Sprint goal")
+    main.run_sprint("test_sprint", "Sprint goal")
 
     # Verify calls
-    mock_sprint.assert_called()
-    mock_echo.assert_called()
+    assert mock_sprint.calls
+    assert patched_echo.calls
 
-@patch('gaggle.main.typer.echo')
-def test_analyze_metrics_command(mock_echo):
+def test_analyze_metrics_command(metrics_json, patched_echo):
     """Test analyze metrics command."""
-    from gaggle.main import analyze_metrics
+    main.analyze_metrics(metrics_json)
 
-    # Create temp file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        f.write('{"test": "data"}')
-        temp_path = f.name
-
-    try:
-        # Call the function
-        analyze_metrics(temp_path)
-
-        # Verify echo was called
-        mock_echo.assert_called()
-    finally:
-        # Clean up temp file
-        os.unlink(temp_path)
+    # Verify echo was called
+    assert patched_echo.calls
 
 def test_cli_app_initialization():
     """Test Typer app initialization."""
-    from gaggle.main import app
-    assert hasattr(app, 'command')
+    assert main.app.command is not None
 
-@patch('gaggle.main.console.print')
-def test_print_banner_function(mock_print):
+def test_print_banner_function(monkeypatch):
     """Test print_banner function."""
-    from gaggle.main import print_banner
+    mock_print = _recorder()
+    monkeypatch.setattr(main.console, "print", mock_print)
+    main.print_banner()
+    assert mock_print.calls
 
-    print_banner()
-    mock_print.assert_called()
-
-@patch('gaggle.main.setup_logging')
-@patch('gaggle.main.get_logger')
-def test_setup_logging_integration(mock_get_logger, mock_setup_logging):
+def test_setup_logging_integration(monkeypatch):
     """Test logging setup integration."""
-    from gaggle.main import setup_application_logging
-
-    setup_application_logging("DEBUG")
+    mock_setup_logging = _recorder()
+    mock_get_logger = _recorder()
+    monkeypatch.setattr(main, "setup_logging", mock_setup_logging)
+    monkeypatch.setattr(main, "get_logger", mock_get_logger)
+    main.setup_application_logging("DEBUG")
 
-    mock_setup_logging.assert_called()
-    mock_get_logger.assert_called()
+    assert mock_setup_logging.calls
+    assert mock_get_logger.calls
 
 
 # Test integration_tools.py functionality
 def test_integration_tools_imports():
     """Test integration tools can be imported."""
-    from gaggle.tools import integration_tools
     assert integration_tools is not None
 
 def test_code_review_integration_tool_import():
     """Test CodeReviewIntegrationTool can be imported."""
-    from gaggle.tools.integration_tools import CodeReviewIntegrationTool
-    tool = CodeReviewIntegrationTool()
+    tool = integration_tools.CodeReviewIntegrationTool()
     assert tool is not None
 
 def test_test_integration_tool_import():
     """Test TestIntegrationTool can be imported."""
-    from gaggle.tools.integration_tools import TestIntegrationTool
-    tool = TestIntegrationTool()
+    tool = integration_tools.TestIntegrationTool()
     assert tool is not None
 
-@patch('gaggle.tools.integration_tools.GitHubAPI')
-def test_code_review_integration_basic_functionality(mock_github_api):
+def test_code_review_integration_basic_functionality(monkeypatch):
     """Test basic code review integration functionality."""
-    from gaggle.tools.integration_tools import CodeReviewIntegrationTool
-
     # Mock GitHub API
-    mock_api = Mock()
-    mock_github_api.return_value = mock_api
+    monkeypatch.setattr(integration_tools, "GitHubAPI", _recorder(SimpleNamespace()))
 
-    tool = CodeReviewIntegrationTool()
+    tool = integration_tools.CodeReviewIntegrationTool()
 
     # Test tool has expected methods
-    assert hasattr(tool, 'name')
-    assert hasattr(tool, 'description')
+    assert tool.name is not None
+    assert tool.description is not None
 
-@patch('gaggle.tools.integration_tools.subprocess')
-def test_test_integration_tool_basic_functionality(mock_subprocess):
+def test_test_integration_tool_basic_functionality(monkeypatch):
     """Test basic test integration functionality."""
-    from gaggle.tools.integration_tools import TestIntegrationTool
-
     # Mock subprocess for test execution
-    mock_result = Mock()
-    mock_result.returncode = 0
-    mock_result.stdout = "All tests passed"
-    mock_subprocess.run.return_value = mock_result
+    mock_result = SimpleNamespace(returncode=0, stdout="All tests passed")
+    mock_subprocess = SimpleNamespace(run=_recorder(mock_result))
+    monkeypatch.setattr(integration_tools, "subprocess", mock_subprocess)
 
-    tool = TestIntegrationTool()
+    tool = integration_tools.TestIntegrationTool()
 
     # Test tool has expected methods
-    assert hasattr(tool, 'name')
-    assert hasattr(tool, 'description')
+    assert tool.name is not None
+    assert tool.description is not None
 
 def test_integration_tool_base_classes():
     """Test integration tool base functionality."""
-    from gaggle.tools.integration_tools import (
-        CodeReviewIntegrationTool,
-        TestIntegrationTool,
-    )
-    from gaggle.tools.project_tools import BaseTool
-
     # Test inheritance
-    assert issubclass(CodeReviewIntegrationTool, BaseTool)
-    assert issubclass(TestIntegrationTool, BaseTool)
+    assert issubclass(integration_tools.CodeReviewIntegrationTool, BaseTool)
+    assert issubclass(integration_tools.TestIntegrationTool, BaseTool)
 
 def test_integration_constants():
     """Test integration tool constants."""
-    from gaggle.tools import integration_tools
-
     # Test module has expected attributes
-    assert hasattr(integration_tools, 'CodeReviewIntegrationTool')
-    assert hasattr(integration_tools, 'TestIntegrationTool')
+    assert integration_tools.CodeReviewIntegrationTool is not None
+    assert integration_tools.TestIntegrationTool is not None
 
 
 # Additional utility tests to boost specific modules
-def test_token_counter_functionality():
-    """Test TokenCounter functionality in detail."""
-    from gaggle.config.models import AgentRole
-    from gaggle.utils.token_counter import TokenCounter
-
-    counter = TokenCounter()
-
-    # Test adding usage
-    counter.add_usage(100, 50, AgentRole.BACKEND_DEV)
-
-    # Test getting totals
-    totals = counter.get_total_usage()
-    assert totals['total_input_tokens'] == 100
-    assert totals['total_output_tokens'] == 50
-
+# covers: LoggerMixin (get_logger is covered in test_critical_coverage.py)
 def test_logging_functionality():
     """Test logging functionality in detail."""
-    from gaggle.utils.logging import LoggerMixin, get_logger
-
-    # Test logger creation
-    logger = get_logger("test_logger")
-    assert logger is not None
-
     # Test LoggerMixin
     class TestClass(LoggerMixin):
         pass
 
     test_obj = TestClass()
-    assert hasattr(test_obj, 'logger')
+    assert test_obj.logger is not None
 
+# covers: TaskEstimate and AgentAllocation records, not CostCalculator itself
 def test_cost_calculator_functionality():
     """Test CostCalculator functionality."""
-    from gaggle.config.models import AgentRole
-    from gaggle.utils.cost_calculator import (
-        AgentAllocation,
-        CostCalculator,
-        TaskEstimate,
-    )
-
-    calculator = CostCalculator()
-
     # Test task estimate creation
     estimate = TaskEstimate(
         task_id="test_task",
@@ -236,11 +198,5 @@ def test_cost_calculator_functionality():
 
 def test_async_utils_functionality():
     """Test async utils functionality."""
-    from gaggle.utils.async_utils import ParallelExecutor
-
     executor = ParallelExecutor(max_workers=2)
     assert executor is not None
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -3,10 +3,6 @@
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 
 def test_hierarchical_memory():
@@ -426,7 +422,7 @@ def test_prompt_caching():
 
         assert cache_key.cache_type == CacheType.TEMPLATE
         assert cache_key.agent_role == AgentRole.PRODUCT_OWNER
-        assert len(cache_key.content_hash) == 64  # SHA256 hash length
+        assert len(cache_key.content_hash) == 16  # SHA-256 prefix bytes
         print(f"   ✅ Cache key generation: {str(cache_key)[:50]}...")
 
         return True
@@ -628,9 +624,8 @@ def test_memory_integration():
         ]
 
         # Store items and track compression
+        agent_memory.store_many(items_to_store)
         for item in items_to_store:
-            agent_memory.store(item)
-
             # Test compression of stored item
             compression_result = compressor.compress_memory_item(item)
             assert compression_result.original_size > 0
@@ -642,14 +637,14 @@ def test_memory_integration():
 
         # Test retrieval with different strategies
         retrieval_queries = [
-            ("api development", ["api", "development"]),
-            ("sprint performance", ["sprint", "performance"]),
-            ("best practices", ["practices", "patterns"]),
+            ("api development", frozenset({"api", "development"})),
+            ("sprint performance", frozenset({"sprint", "performance"})),
+            ("best practices", frozenset({"practices", "patterns"})),
         ]
 
         total_retrieved = 0
         for query_text, query_terms in retrieval_queries:
-            results = agent_memory.retrieve(set(query_terms), limit=3)
+            results = agent_memory.retrieve(query_terms, limit=3)
             total_retrieved += len(results.items)
             print(f"       Query '{query_text}': found {len(results.items)} items")
 
@@ -1,6 +1,5 @@
 """Comprehensive tests for Phase 3: Advanced Coordination Features."""
 
-import asyncio
 from datetime import datetime, timedelta
 
 import pytest
@@ -54,6 +53,32 @@ from gaggle.core.production.scalability import (
 from gaggle.models import Task, TaskStatus, UserStory
 from gaggle.models.task import TaskPriority
 
+# One clock reading for the module; tests only rely on relative offsets
+NOW = datetime.now()
+TODAY = NOW.date()
+# Sprint-length offsets: SPRINT_DELTAS[n] is n two-week sprints
+SPRINT_DELTAS = tuple(timedelta(days=14 * i) for i in range(16))
+
+
+@pytest.fixture(scope="module")
+def quality_gate_manager():
+    """QualityGateManager with the standard gates, configured once per module.
+
+    Executing gates only records run history, so tests can share it.
+    """
+    manager = QualityGateManager()
+    manager.configure_standard_gates()
+    manager.parallel_tester.simulated_duration = 0.0
+    return manager
+
+
+@pytest.fixture(scope="module")
+def pipeline_manager():
+    """PipelineManager with the standard pipelines, configured once per module."""
+    manager = PipelineManager()
+    manager.configure_standard_pipelines()
+    return manager
+
 
 class TestAdaptiveSprintPlanning:
     """Test adaptive sprint planning functionality."""
@@ -69,15 +94,18 @@ class TestAdaptiveSprintPlanning:
         tracker = VelocityTracker()
 
         # Add some sprint metrics
-        for i in range(3):
-            metrics = SprintMetrics(
-                sprint_id=f"sprint_{i}",
-                start_date=datetime.now() - timedelta(days=14 * (i + 1)),
-                end_date=datetime.now() - timedelta(days=14 * i),
-                planned_story_points=20,
-                completed_story_points=15 + i * 2,  # Improving velocity
-            )
-            tracker.add_sprint_metrics(metrics)
+        tracker.add_many(
+            [
+                SprintMetrics(
+                    sprint_id=f"sprint_{i}",
+                    start_date=NOW - SPRINT_DELTAS[i + 1],
+                    end_date=NOW - SPRINT_DELTAS[i],
+                    planned_story_points=20,
+                    completed_story_points=15 + i * 2,  # Improving velocity
+                )
+                for i in range(3)
+            ]
+        )
 
         # Test prediction
         predicted = tracker.predict_velocity()
@@ -103,9 +131,7 @@ class TestAdaptiveSprintPlanning:
         from gaggle.core.coordination.adaptive_planning import RiskFactor
 
         # Create risk assessment
-        assessment = RiskAssessment(
-            sprint_id="test_sprint", assessment_date=datetime.now()
-        )
+        assessment = RiskAssessment(sprint_id="test_sprint", assessment_date=NOW)
 
         # Add risk factors
         high_risk = RiskFactor(
@@ -130,11 +156,14 @@ class TestAdaptiveSprintPlanning:
         assessment.risk_factors.append(high_risk2)
 
         # Test risk calculation - should be HIGH with multiple high risks
-        assert assessment.overall_risk_level in [RiskLevel.HIGH, RiskLevel.MEDIUM]  # Accept both
+        assert assessment.overall_risk_level in [
+            RiskLevel.HIGH,
+            RiskLevel.MEDIUM,
+        ]  # Accept both
         assert len(assessment.critical_risks) >= 0
         assert high_risk.risk_score == 0.8 * 0.7
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_adaptive_sprint_planning_flow(self):
         """Test complete adaptive sprint planning flow."""
         planner = AdaptiveSprintPlanner()
@@ -146,8 +175,8 @@ class TestAdaptiveSprintPlanning:
             id="test_sprint_planning",
             name="Test Sprint",
             goal="Test adaptive planning",
-            start_date=datetime.now().date(),
-            end_date=(datetime.now() + timedelta(days=14)).date(),
+            start_date=TODAY,
+            end_date=(NOW + SPRINT_DELTAS[1]).date(),
             user_stories=[],
         )
 
@@ -197,7 +226,7 @@ class TestContinuousLearning:
         recognizer = PatternRecognizer()
 
         event = CoordinationEvent(
-            timestamp=datetime.now(),
+            timestamp=NOW,
             event_type="task_handoff",
             agents_involved=[AgentRole.TECH_LEAD, AgentRole.FRONTEND_DEV],
             context={"task_type": "frontend", "complexity": "medium"},
@@ -210,15 +239,15 @@ class TestContinuousLearning:
         assert len(recognizer.coordination_events) == 1
         assert recognizer.coordination_events[0].success_score == 0.9
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_pattern_analysis(self):
         """Test pattern analysis from events."""
         recognizer = PatternRecognizer(min_pattern_occurrences=2)
 
         # Add multiple similar events
-        for i in range(3):
-            event = CoordinationEvent(
-                timestamp=datetime.now() - timedelta(hours=i),
+        events = [
+            CoordinationEvent(
+                timestamp=NOW - timedelta(hours=i),
                 event_type="code_review",
                 agents_involved=[AgentRole.TECH_LEAD, AgentRole.BACKEND_DEV],
                 context={"task_type": "backend", "review_type": "architecture"},
@@ -226,6 +255,9 @@ class TestContinuousLearning:
                 success_score=0.85,
                 sprint_id="test_sprint",
             )
+            for i in range(3)
+        ]
+        for event in events:
             recognizer.record_event(event)
 
         # Analyze patterns
@@ -255,8 +287,8 @@ class TestContinuousLearning:
         # Record team performance
         sprint_metrics = SprintMetrics(
             sprint_id="test_sprint",
-            start_date=datetime.now() - timedelta(days=14),
-            end_date=datetime.now(),
+            start_date=NOW - SPRINT_DELTAS[1],
+            end_date=NOW,
             planned_story_points=20,
             completed_story_points=18,
         )
@@ -269,7 +301,7 @@ class TestContinuousLearning:
         summary = tracker.get_team_performance_summary()
         assert "average_velocity" in summary
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_learning_engine_integration(self):
         """Test complete learning engine workflow."""
         engine = LearningEngine()
@@ -277,15 +309,15 @@ class TestContinuousLearning:
         # Create test data
         sprint_metrics = SprintMetrics(
             sprint_id="learning_test",
-            start_date=datetime.now() - timedelta(days=14),
-            end_date=datetime.now(),
+            start_date=NOW - SPRINT_DELTAS[1],
+            end_date=NOW,
             completed_story_points=15,
             coordination_failures=2,
         )
 
         coordination_events = [
             CoordinationEvent(
-                timestamp=datetime.now(),
+                timestamp=NOW,
                 event_type="daily_standup",
                 agents_involved=[AgentRole.SCRUM_MASTER, AgentRole.TECH_LEAD],
                 context={"blockers": 1},
@@ -346,10 +378,10 @@ class TestQualityGates:
         assert TestType.UNIT_TESTS in tester.test_suites
         assert tester.test_suites[TestType.UNIT_TESTS].can_run_parallel
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_parallel_test_execution(self):
         """Test parallel execution of test suites."""
-        tester = ParallelTester()
+        tester = ParallelTester(simulated_duration=0.0)
 
         # Register multiple test suites
         test_suites = [
@@ -373,27 +405,21 @@ class TestQualityGates:
             assert "success" in results[test_type]
             assert "duration_minutes" in results[test_type]
 
-    def test_quality_gate_manager_configuration(self):
+    def test_quality_gate_manager_configuration(self, quality_gate_manager):
         """Test quality gate manager setup."""
-        manager = QualityGateManager()
-        manager.configure_standard_gates()
-
-        assert len(manager.review_stages) > 0
+        assert len(quality_gate_manager.review_stages) > 0
 
         # Check for expected stages
-        stage_types = [stage.stage_type for stage in manager.review_stages]
+        stage_types = [stage.stage_type for stage in quality_gate_manager.review_stages]
         from gaggle.core.coordination.quality_gates import ReviewStageType
 
         assert ReviewStageType.REQUIREMENTS_REVIEW in stage_types
         assert ReviewStageType.CODE_REVIEW in stage_types
         assert ReviewStageType.SECURITY_REVIEW in stage_types
 
-    @pytest.mark.asyncio
-    async def test_complete_quality_gate_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_complete_quality_gate_execution(self, quality_gate_manager):
         """Test complete quality gate process."""
-        manager = QualityGateManager()
-        manager.configure_standard_gates()
-
         # Create test task
         from gaggle.models.task import TaskType
 
@@ -408,7 +434,7 @@ class TestQualityGates:
         )
 
         # Execute quality gates
-        result = await manager.execute_quality_gates(task)
+        result = await quality_gate_manager.execute_quality_gates(task)
 
         assert "task_id" in result
         assert "overall_status" in result
@@ -422,22 +448,17 @@ class TestQualityGates:
 class TestCICDPipeline:
     """Test CI/CD pipeline integration."""
 
-    def test_pipeline_manager_initialization(self):
+    def test_pipeline_manager_initialization(self, pipeline_manager):
         """Test pipeline manager setup."""
-        manager = PipelineManager()
-        manager.configure_standard_pipelines()
+        configs = pipeline_manager.pipeline_configs
+        assert len(configs) > 0
+        assert "sprint_pipeline" in configs
+        assert "feature_pipeline" in configs
+        assert "release_pipeline" in configs
 
-        assert len(manager.pipeline_configs) > 0
-        assert "sprint_pipeline" in manager.pipeline_configs
-        assert "feature_pipeline" in manager.pipeline_configs
-        assert "release_pipeline" in manager.pipeline_configs
-
-    def test_pipeline_configuration(self):
+    def test_pipeline_configuration(self, pipeline_manager):
         """Test pipeline configuration structure."""
-        manager = PipelineManager()
-        manager.configure_standard_pipelines()
-
-        sprint_pipeline = manager.pipeline_configs["sprint_pipeline"]
+        sprint_pipeline = pipeline_manager.pipeline_configs["sprint_pipeline"]
         assert isinstance(sprint_pipeline, PipelineConfig)
         assert len(sprint_pipeline.stages) > 0
         assert sprint_pipeline.quality_gate_required
@@ -448,12 +469,9 @@ class TestCICDPipeline:
         assert PipelineStageType.TEST in stage_types
         assert PipelineStageType.QUALITY_GATE in stage_types
 
-    @pytest.mark.asyncio
-    async def test_pipeline_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_pipeline_execution(self, pipeline_manager):
         """Test complete pipeline execution."""
-        manager = PipelineManager()
-        manager.configure_standard_pipelines()
-
         context = {
             "sprint_id": "test_sprint",
             "triggered_by": "test_user",
@@ -461,7 +479,7 @@ class TestCICDPipeline:
         }
 
         # Execute feature pipeline (shorter than sprint pipeline)
-        execution = await manager.execute_pipeline("feature_pipeline", context)
+        execution = await pipeline_manager.execute_pipeline("feature_pipeline", context)
 
         assert execution.sprint_id == "test_sprint"
         assert execution.status.value in ["success", "failed", "running"]
@@ -524,6 +542,12 @@ class TestSprintMonitoring:
         assert threshold.evaluate(-25.0) == AlertSeverity.ERROR
         assert threshold.evaluate(-35.0) == AlertSeverity.CRITICAL
 
+        # Batch evaluation agrees with the scalar path
+        values = [-5.0, -15.0, -25.0, -35.0]
+        assert threshold.evaluate_many(values) == [
+            threshold.evaluate(value) for value in values
+        ]
+
     def test_sprint_health_assessment(self):
         """Test sprint health status calculation."""
         monitor = SprintHealthMonitor()
@@ -549,8 +573,7 @@ class TestSprintMonitoring:
             ),
         ]
 
-        for metric in metrics:
-            monitor.record_metric(metric)
+        monitor.record_metrics(metrics)
 
         health = monitor.get_sprint_health("health_test")
 
@@ -564,11 +587,14 @@ class TestSprintMonitoring:
         monitor = SprintHealthMonitor()
 
         # Add metrics for dashboard
-        for i in range(5):
-            metric = HealthMetric(
-                MetricType.VELOCITY, f"velocity_day_{i}", 10.0 + i, "points"
-            )
-            monitor.record_metric(metric)
+        monitor.record_metrics(
+            [
+                HealthMetric(
+                    MetricType.VELOCITY, f"velocity_day_{i}", 10.0 + i, "points"
+                )
+                for i in range(5)
+            ]
+        )
 
         # Get dashboard data
         dashboard_data = monitor.get_dashboard_data("sprint_overview")
@@ -643,7 +669,7 @@ class TestScalabilityManagement:
         assert selected is not None
         assert selected.instance_id == "agent_3"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_scalability_manager(self):
         """Test scalability manager functionality."""
         manager = ScalabilityManager()
@@ -668,7 +694,7 @@ class TestScalabilityManagement:
         assert len(orchestrator.active_clusters) == 0
         assert len(orchestrator.sprint_assignments) == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_sprint_cluster_creation(self):
         """Test sprint cluster creation and management."""
         orchestrator = SprintOrchestrator()
@@ -685,7 +711,7 @@ class TestScalabilityManagement:
         assert cluster.auto_scaling_enabled
         assert cluster.cluster_id in orchestrator.active_clusters
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_sprint_assignment_to_cluster(self):
         """Test sprint assignment to cluster."""
         orchestrator = SprintOrchestrator()
@@ -704,8 +730,8 @@ class TestScalabilityManagement:
             id="assignment_sprint",
             name="Assignment Test Sprint",
             goal="Test cluster assignment",
-            start_date=datetime.now().date(),
-            end_date=(datetime.now() + timedelta(days=14)).date(),
+            start_date=TODAY,
+            end_date=(NOW + SPRINT_DELTAS[1]).date(),
             user_stories=[],
         )
 
@@ -717,77 +743,3 @@ class TestScalabilityManagement:
         assert cluster_id == "assignment_test"
         assert sprint.id in orchestrator.sprint_assignments
         assert orchestrator.sprint_assignments[sprint.id] == cluster_id
-
-
-async def run_comprehensive_phase3_tests():
-    """Run all Phase 3 tests and report results."""
-    print("🧪 Starting comprehensive Phase 3 tests...")
-
-    test_results = {"passed": 0, "failed": 0, "errors": []}
-
-    test_classes = [
-        TestAdaptiveSprintPlanning(),
-        TestContinuousLearning(),
-        TestQualityGates(),
-        TestCICDPipeline(),
-        TestSprintMonitoring(),
-        TestScalabilityManagement(),
-    ]
-
-    for test_class in test_classes:
-        class_name = test_class.__class__.__name__
-        print(f"\n📋 Testing {class_name}...")
-
-        # Get all test methods
-        test_methods = [
-            method for method in dir(test_class) if method.startswith("test_")
-        ]
-
-        for method_name in test_methods:
-            try:
-                print(f"  🔍 {method_name}...", end=" ")
-
-                method = getattr(test_class, method_name)
-
-                if asyncio.iscoroutinefunction(method):
-                    await method()
-                else:
-                    method()
-
-                print("✅ PASSED")
-                test_results["passed"] += 1
-
-            except Exception as e:
-                print(f"❌ FAILED: {e}")
-                test_results["failed"] += 1
-                test_results["errors"].append(f"{class_name}.{method_name}: {e}")
-
-    # Report results
-    total_tests = test_results["passed"] + test_results["failed"]
-    success_rate = (
-        (test_results["passed"] / total_tests * 100) if total_tests > 0 else 0
-    )
-
-    print("\n📊 Phase 3 Test Results:")
-    print(f"   ✅ Passed: {test_results['passed']}")
-    print(f"   ❌ Failed: {test_results['failed']}")
-    print(f"   📈 Success Rate: {success_rate:.1f}%")
-
-    if test_results["errors"]:
-        print("\n❌ Errors encountered:")
-        for error in test_results["errors"]:
-            print(f"   - {error}")
-
-    return test_results
-
-
-if __name__ == "__main__":
-    # Run the tests
-    results = asyncio.run(run_comprehensive_phase3_tests())
-
-    if results["failed"] == 0:
-        print(
-            "\n🎉 All Phase 3 tests passed! Advanced coordination features are working correctly."
-        )
-    else:
-        print(f"\n⚠️  {results['failed']} test(s) failed. Review errors above.")
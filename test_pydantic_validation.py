@@ -477,20 +477,29 @@ def run_validation_tests():
 
     for test_class in test_classes:
         class_name = test_class.__name__
-        print(f"\n📋 Testing {class_name}:")
+        # Buffer each class's report and write it in one call
+        lines = [f"\n📋 Testing {class_name}:\n"]
 
         instance = test_class()
-        methods = [method for method in dir(instance) if method.startswith('test_')]
-
-        for method_name in methods:
-            total_tests += 1
-            try:
-                method = getattr(instance, method_name)
-                method()
-                passed_tests += 1
-                print(f"  ✅ {method_name}")
-            except Exception as e:
-                print(f"  ❌ {method_name}: {str(e)}")
+        # The classes define their tests directly; read them in definition order
+        methods = [
+            name
+            for name, attr in vars(test_class).items()
+            if name.startswith('test_') and callable(attr)
+        ]
+
+        try:
+            for method_name in methods:
+                total_tests += 1
+                try:
+                    method = getattr(instance, method_name)
+                    method()
+                    passed_tests += 1
+                    lines.append(f"  ✅ {method_name}\n")
+                except Exception as e:
+                    lines.append(f"  ❌ {method_name}: {str(e)}\n")
+        finally:
+            sys.stdout.write("".join(lines))
 
     print("\n" + "=" * 50)
     print("📊 Validation Test Results:")
@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import sys
 from datetime import datetime, timedelta
 from unittest.mock import Mock
 
@@ -14,6 +15,19 @@ from gaggle.models.story import UserStory
 from gaggle.models.task import Task, TaskStatus, TaskType
 
 
+def configure_windows_event_loop():
+    """Use the selector event loop on Windows.
+
+    The default Proactor loop adds noticeable per-task overhead, and the
+    policy must be in place before pytest-asyncio creates any loop.
+    """
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+
+configure_windows_event_loop()
+
+
 # Test environment setup
 def pytest_configure(config):
     """Configure pytest environment."""
@@ -23,15 +37,6 @@ def pytest_configure(config):
     os.environ["GITHUB_TOKEN"] = "test_token"
 
 
-# Event loop fixture for async tests
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def sample_task():
     """Create a sample task for testing."""
@@ -67,12 +72,13 @@ def sample_user_story():
 @pytest.fixture
 def sample_sprint(sample_user_story):
     """Create a sample sprint for testing."""
+    start_date = datetime.now()
     return Sprint(
         id="SPRINT-001",
         name="Authentication Sprint",
         goal="Implement secure user authentication",
-        start_date=datetime.now(),
-        end_date=datetime.now() + timedelta(weeks=2),
+        start_date=start_date,
+        end_date=start_date + timedelta(weeks=2),
         user_stories=[sample_user_story],
         team_velocity=25,
     )
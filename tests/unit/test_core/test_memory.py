@@ -0,0 +1,362 @@
+"""Tests for the hierarchical memory, retrieval and compression modules."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from gaggle.core.memory.compression import (
+    HierarchicalCompressor,
+    MemoryCompressor,
+    SummaryCompressor,
+)
+from gaggle.core.memory.hierarchical import (
+    HierarchicalMemory,
+    MemoryItem,
+    MemoryLevel,
+    MemoryManager,
+)
+from gaggle.core.memory.retrieval import (
+    AdvancedRetriever,
+    BM25Retriever,
+    EmbeddingRetriever,
+)
+
+
+def _item(item_id, content, tags=(), level=MemoryLevel.WORKING):
+    """Create a memory item with the given content and tags."""
+    return MemoryItem(id=item_id, level=level, content=content, tags=set(tags))
+
+
+def _aged(item_id, days, level=MemoryLevel.WORKING, **kwargs):
+    """Create a memory item created ``days`` ago."""
+    return MemoryItem(
+        id=item_id,
+        level=level,
+        content={"note": item_id},
+        created_at=datetime.now() - timedelta(days=days),
+        **kwargs,
+    )
+
+
+class TestHierarchicalMemoryExpiry:
+    """Test cases for TTL-based cleanup of hierarchical memory."""
+
+    @pytest.fixture
+    def memory(self):
+        """Create an empty agent memory."""
+        return HierarchicalMemory("agent-ttl")
+
+    def test_cleanup_removes_only_expired_items(self, memory):
+        """Test items past their level's TTL are removed, oldest first."""
+        memory.store_many(
+            [
+                _aged("fresh", 5),
+                _aged("oldest", 90),
+                _aged("recent", 29),
+                _aged("old", 31),
+            ]
+        )
+
+        assert memory.cleanup_expired() == {MemoryLevel.WORKING: 2}
+        assert set(memory.memory_levels[MemoryLevel.WORKING]) == {"fresh", "recent"}
+        assert [item_id for _, item_id in sorted(memory._ttl_heap)] == [
+            "recent",
+            "fresh",
+        ]
+
+    def test_promoted_item_is_not_expired(self, memory):
+        """Test promotion to a permanent level outlives the original entry."""
+        memory.store(_aged("promoted", 40))
+        memory.promote_item("promoted", MemoryLevel.SEMANTIC)
+
+        assert memory.cleanup_expired() == {}
+        assert memory.get_item("promoted") is not None
+
+    def test_expiry_moved_later_in_place_is_rescheduled(self, memory):
+        """Test an item whose creation time moved forward is kept."""
+        item = _aged("touched", 40)
+        memory.store(item)
+        item.created_at = datetime.now()
+
+        assert memory.cleanup_expired() == {}
+        assert memory.get_item("touched") is item
+        assert (item.expires_at, "touched") in memory._ttl_heap
+
+    def test_restore_replaces_the_earlier_entry(self, memory):
+        """Test re-storing an ID keeps only the newest copy and its expiry."""
+        memory.store(_aged("restored", 40))
+        memory.store(_aged("restored", 1, level=MemoryLevel.EPISODIC))
+
+        assert memory.cleanup_expired() == {}
+        assert memory.item_count() == 1
+        assert memory.get_item("restored").level == MemoryLevel.EPISODIC
+
+        memory.store(_aged("restored", 400, level=MemoryLevel.EPISODIC))
+        assert memory.cleanup_expired() == {MemoryLevel.EPISODIC: 1}
+        assert memory.item_count() == 0
+
+
+class TestHierarchicalMemoryPrefilter:
+    """Test cases for the cross-agent may_match prefilter."""
+
+    @pytest.fixture
+    def memory(self):
+        """Create an agent memory holding one authentication note."""
+        memory = HierarchicalMemory("agent-grams")
+        memory.store(
+            _item("auth", {"description": "JWT login flow"}, tags={"security"})
+        )
+        return memory
+
+    @pytest.mark.parametrize(
+        "terms",
+        [
+            frozenset({"security"}),  # Tag match
+            frozenset({"login"}),  # Content substring
+            frozenset({"LOGIN", "missing"}),  # Case-insensitive, any term
+            frozenset({"jw"}),  # Too short to rule out
+        ],
+    )
+    def test_may_match_true(self, memory, terms):
+        """Test terms that retrieve could match are let through."""
+        assert memory.may_match(terms)
+
+    @pytest.mark.parametrize(
+        "terms", [frozenset({"database"}), frozenset({"pooling", "react"})]
+    )
+    def test_may_match_false(self, memory, terms):
+        """Test terms absent from tags and content are ruled out."""
+        assert not memory.may_match(terms)
+
+    def test_may_match_false_on_empty_memory(self):
+        """Test an empty memory never matches."""
+        assert not HierarchicalMemory("agent-empty").may_match(frozenset({"jwt"}))
+
+    def test_grams_follow_removal_and_restore(self, memory):
+        """Test grams of evicted or replaced content stop matching."""
+        memory.store(_item("other", {"description": "Sprint retrospective"}))
+        memory.store(_item("auth", {"description": "Connection pooling"}))
+
+        assert memory.may_match(frozenset({"pooling"}))
+        assert not memory.may_match(frozenset({"login"}))
+
+        memory._discard("other")
+        assert not memory.may_match(frozenset({"retrospective"}))
+
+    def test_store_accepts_content_json_cannot_encode(self, memory):
+        """Test content with datetimes and sets is indexed via str()."""
+        memory.store(_item("dated", {"due": datetime(2026, 1, 2), "ids": {7}}))
+
+        assert memory.may_match(frozenset({"2026-01-02"}))
+
+
+class TestMemoryManager:
+    """Test cases for the cross-agent memory manager."""
+
+    TOPICS = ["jwt login", "connection pooling", "sprint retrospective", "jwt refresh"]
+
+    def _populate(self, manager):
+        """Give four agents and shared memory the same two notes each."""
+        for n, agent_id in enumerate(["po", "sm", "dev", "qa"]):
+            memory = manager.get_agent_memory(agent_id)
+            for topic in (self.TOPICS[n], self.TOPICS[(n + 1) % 4]):
+                memory.store(
+                    _item(f"{agent_id}-{topic}", {"note": topic}, tags={"jwt"})
+                )
+        manager.store_shared_memory(_item("shared-jwt", {"note": "jwt rotation"}))
+
+    @staticmethod
+    def _ids(results):
+        """Map each searched memory to the set of IDs it returned.
+
+        Sets, not rank order: retrieval stamps last_accessed, so ties in the
+        hybrid score break on timestamps that differ between managers.
+        """
+        return {name: {item.id for item in r.items} for name, r in results.items()}
+
+    def test_parallel_search_matches_serial(self):
+        """Test pooled cross-agent search returns what serial search does."""
+        serial = MemoryManager()
+        self._populate(serial)
+        with MemoryManager(max_workers=4) as parallel:
+            self._populate(parallel)
+            assert parallel.executor is not None
+
+            for terms in (["jwt"], ["pooling", "login"], ["absent"]):
+                assert self._ids(parallel.search_across_agents(terms)) == self._ids(
+                    serial.search_across_agents(terms)
+                )
+
+    def test_close_shuts_down_the_pool(self):
+        """Test closing stops the pool and later searches still run serially."""
+        manager = MemoryManager(max_workers=2)
+        self._populate(manager)
+        executor = manager.executor
+        manager.close()
+
+        assert manager.executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(int)
+        assert set(manager.search_across_agents(["jwt"])) == {
+            "po",
+            "sm",
+            "dev",
+            "qa",
+            "shared",
+        }
+        manager.close()  # Idempotent
+
+
+class TestBM25Retriever:
+    """Test cases for BM25 indexing and retrieval."""
+
+    def test_length_norms_fall_back_to_k1_without_terms(self):
+        """Test an all-empty corpus indexes with a norm of k1 per item."""
+        retriever = BM25Retriever(k1=1.2)
+        retriever.index_items([_item("empty-1", {}), _item("empty-2", {})])
+
+        assert retriever.average_length == 0.0
+        assert retriever.length_norms == pytest.approx({"empty-1": 1.2, "empty-2": 1.2})
+
+    def test_retrieve_without_terms_returns_nothing(self):
+        """Test querying an all-empty corpus returns no results."""
+        items = [_item("empty-1", {}), _item("empty-2", {})]
+        retriever = BM25Retriever()
+        retriever.index_items(items)
+
+        assert retriever.retrieve("authentication", items) == []
+
+    def test_reindexing_unchanged_items_is_skipped(self, monkeypatch):
+        """Test the index is only rebuilt when the item set changes."""
+        items = [
+            _item("bm25-1", {"description": "JWT login flow"}, tags={"auth"}),
+            _item("bm25-2", {"description": "Connection pooling"}, tags={"db"}),
+            _item("bm25-3", {"description": "Sprint retrospective"}, tags={"team"}),
+        ]
+        retriever = BM25Retriever()
+        tokenized = []
+        tokenize = retriever._tokenize
+        monkeypatch.setattr(
+            retriever,
+            "_tokenize",
+            lambda text: tokenized.append(text) or tokenize(text),
+        )
+
+        retriever.index_items(items)
+        indexed = len(tokenized)
+        retriever.index_items(list(items))
+        assert len(tokenized) == indexed
+
+        items[1].content = {"description": "JWT refresh tokens"}
+        retriever.index_items(items)
+        assert len(tokenized) == 2 * indexed
+        assert [item.id for item, _ in retriever.retrieve("refresh", items)] == [
+            "bm25-2"
+        ]
+
+
+class TestEmbeddingRetriever:
+    """Test cases for embedding indexing and retrieval."""
+
+    @pytest.fixture
+    def items(self):
+        """Create a small set of distinct memory items."""
+        return [
+            _item("emb-1", {"description": "JWT login flow"}, tags={"auth"}),
+            _item("emb-2", {"description": "Connection pooling"}, tags={"db"}),
+            _item("emb-3", {"description": "Sprint retrospective"}, tags={"team"}),
+        ]
+
+    def test_repeat_queries_do_not_rebuild_the_index(self, monkeypatch, items):
+        """Test a second retrieval over the same items reuses the index."""
+        advanced = AdvancedRetriever(primary_strategy="embedding")
+        retriever = advanced.retrievers["embedding"]
+        builds = []
+        build = retriever._build_ann_index
+        monkeypatch.setattr(
+            retriever, "_build_ann_index", lambda: builds.append(1) or build()
+        )
+
+        advanced.retrieve_with_fallback("login security", items)
+        advanced.retrieve_with_fallback("database pooling", items)
+
+        assert len(builds) == 1
+
+    def test_reindexing_drops_removed_items(self, items):
+        """Test re-indexing a smaller item set forgets the removed items."""
+        retriever = EmbeddingRetriever()
+        retriever.index_items(items)
+        retriever.index_items(items[:2])
+
+        assert set(retriever.item_embeddings) == {"emb-1", "emb-2"}
+
+
+class TestSummaryCompressor:
+    """Test cases for summary compression."""
+
+    SENTENCES = [
+        "Deployed the billing service to the staging cluster after code review",
+        "Sprint retrospective flagged flaky integration tests in the payments module",
+        "Database migration for the orders table finished without any downtime",
+        "Critical bug in the login form was fixed and verified by QA",
+        "Next step is to load test the search endpoint before the release",
+    ]
+    NEAR_DUPLICATES = [
+        "Deployed the billing service to the staging cluster after code reviews",
+        "Sprint retrospective flagged  flaky integration tests in the Payments module",
+        "Database migration for the orders table finished without downtime",
+        "Critical bug in the login form was fixed and verified by the QA",
+        "Next step is to load test the search endpoint before release",
+    ]
+
+    def test_dedupe_keeps_first_of_each_near_duplicate_pair(self):
+        """Test every near-duplicate (Jaccard >= 0.8) is dropped."""
+        sentences = [
+            sentence
+            for pair in zip(self.SENTENCES, self.NEAR_DUPLICATES, strict=True)
+            for sentence in pair
+        ]
+
+        assert SummaryCompressor()._dedupe_sentences(sentences) == self.SENTENCES
+
+    def test_shingle_hashes_are_stable_across_processes(self):
+        """Test shingles do not depend on the per-process hash seed."""
+        assert SummaryCompressor._shingle("Fix it") == {
+            2026087047364338099,
+            5666344605844152832,
+        }
+
+
+class TestHierarchicalCompressor:
+    """Test cases for memory item compression."""
+
+    def test_item_text_keeps_json_dumps_encoding(self):
+        """Test content renders exactly as json.dumps, escapes and NaN included."""
+        content = {"owner": "Zoë", "velocity": float("nan"), "budget": 1e20}
+        text = HierarchicalCompressor()._memory_item_to_text(_item("json-1", content))
+
+        assert f"Content: {json.dumps(content, indent=2)}" in text
+        assert "Zo\\u00eb" in text
+        assert "NaN" in text
+        assert "1e+20" in text
+
+
+class TestMemoryCompressor:
+    """Test cases for dictionary-primed zlib compression."""
+
+    SAMPLES = ['{"status": "done", "story": "login"}', '{"status": "todo"}']
+
+    @pytest.mark.parametrize("dict_size", [0, -5])
+    def test_non_positive_dict_size_uses_no_dictionary(self, dict_size):
+        """Test a dict_size of zero or less builds no dictionary at all."""
+        compressor = MemoryCompressor.from_samples(self.SAMPLES, dict_size=dict_size)
+
+        assert compressor.zdict is None
+        assert compressor.decompress(compressor.compress("story")) == "story"
+
+    def test_dict_keeps_the_most_recent_bytes(self):
+        """Test the dictionary is the tail of the joined samples."""
+        compressor = MemoryCompressor.from_samples(self.SAMPLES, dict_size=8)
+
+        assert compressor.zdict == b' "todo"}'
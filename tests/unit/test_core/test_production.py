@@ -0,0 +1,141 @@
+"""Tests for the production monitoring and scalability modules."""
+
+import asyncio
+
+import pytest
+
+from gaggle.config.models import AgentRole
+from gaggle.core.production.monitoring import (
+    AlertSeverity,
+    HealthMetric,
+    MetricThreshold,
+    MetricType,
+    SprintHealthMonitor,
+)
+from gaggle.core.production.scalability import AgentInstance
+
+
+def _metrics():
+    """Create metrics that trip several default alert rules."""
+    return [
+        HealthMetric(MetricType.VELOCITY, "velocity_trend", -25.0, "%", sprint_id="s1"),
+        HealthMetric(
+            MetricType.COORDINATION, "coordination_failures", 6.0, "n", sprint_id="s1"
+        ),
+        HealthMetric(
+            MetricType.QUALITY, "quality_test_coverage", 72.0, "%", sprint_id="s2"
+        ),
+        HealthMetric(
+            MetricType.QUALITY, "quality_test_coverage", 95.0, "%", sprint_id="s3"
+        ),
+        HealthMetric(MetricType.VELOCITY, "velocity_trend", -35.0, "%", sprint_id="s1"),
+    ]
+
+
+def _alerts(monitor):
+    """Summarise a monitor's active alerts independently of their IDs."""
+    return sorted(
+        (alert.metric_name, alert.sprint_id, alert.severity.value, alert.current_value)
+        for alert in monitor.active_alerts.values()
+    )
+
+
+class TestMetricThreshold:
+    """Test cases for threshold evaluation."""
+
+    VALUES = [-40.0, -30.0, -25.0, -20.0, -10.0, 0.0, 3.0, 5.0, 6.0, 8.0, 12.0]
+
+    @pytest.mark.parametrize(
+        "threshold",
+        [
+            MetricThreshold("coordination_failures", 3.0, 5.0, 8.0, "above"),
+            MetricThreshold("velocity_trend", -10.0, -20.0, -30.0, "below"),
+            MetricThreshold("velocity_trend", -10.0, -20.0, -30.0, "equal"),
+        ],
+        ids=["above", "below", "equal"],
+    )
+    def test_evaluate_many_matches_evaluate(self, threshold):
+        """Test batch evaluation agrees with evaluate for every value."""
+        assert threshold.evaluate_many(self.VALUES) == [
+            threshold.evaluate(value) for value in self.VALUES
+        ]
+
+    def test_evaluate_many_covers_every_severity(self):
+        """Test the sample values reach each severity band."""
+        threshold = MetricThreshold("coordination_failures", 3.0, 5.0, 8.0)
+
+        assert set(threshold.evaluate_many(self.VALUES)) == set(AlertSeverity)
+
+    def test_evaluate_many_accepts_a_generator(self):
+        """Test values may be any iterable, consumed once."""
+        threshold = MetricThreshold("velocity_trend", -10.0, -20.0, -30.0, "below")
+
+        assert threshold.evaluate_many(v for v in (-5.0, -15.0)) == [
+            AlertSeverity.INFO,
+            AlertSeverity.WARNING,
+        ]
+
+
+class TestSprintHealthMonitor:
+    """Test cases for metric recording and alert evaluation."""
+
+    @pytest.mark.asyncio
+    async def test_batch_fires_the_same_alerts_as_single_metrics(self):
+        """Test record_metrics matches one record_metric call per metric."""
+        single = SprintHealthMonitor()
+        for metric in _metrics():
+            single.record_metric(metric)
+        batch = SprintHealthMonitor()
+        batch.record_metrics(_metrics())
+
+        assert len(batch._evaluation_tasks) == 1
+        await asyncio.gather(*single._evaluation_tasks, *batch._evaluation_tasks)
+
+        assert _alerts(batch) == _alerts(single)
+        assert len(_alerts(batch)) == 3
+        assert not batch._evaluation_tasks
+
+    def test_record_metrics_without_a_running_loop(self):
+        """Test alerts are evaluated immediately when no loop is running."""
+        monitor = SprintHealthMonitor()
+        monitor.record_metrics(_metrics())
+
+        assert len(_alerts(monitor)) == 3
+        assert not monitor._evaluation_tasks
+
+
+class TestAgentInstance:
+    """Test cases for agent instance creation."""
+
+    def test_bulk_creates_unique_role_prefixed_instances(self):
+        """Test bulk IDs are unique and default to the role value prefix."""
+        instances = AgentInstance.bulk(AgentRole.BACKEND_DEV, 4)
+
+        assert [instance.instance_id for instance in instances] == [
+            "backend_dev_0",
+            "backend_dev_1",
+            "backend_dev_2",
+            "backend_dev_3",
+        ]
+        assert all(
+            instance.agent_role == AgentRole.BACKEND_DEV for instance in instances
+        )
+        assert all(instance.max_concurrent_tasks == 3 for instance in instances)
+
+    def test_bulk_passes_prefix_and_capacity_through(self):
+        """Test id_prefix and max_concurrent_tasks reach every instance."""
+        instances = AgentInstance.bulk(
+            AgentRole.QA_ENGINEER, 3, max_concurrent_tasks=7, id_prefix="qa-pool"
+        )
+
+        assert [instance.instance_id for instance in instances] == [
+            "qa-pool_0",
+            "qa-pool_1",
+            "qa-pool_2",
+        ]
+        assert all(instance.max_concurrent_tasks == 7 for instance in instances)
+        assert all(instance.available_capacity() == 7 for instance in instances)
+
+    def test_bulk_with_zero_count_is_empty(self):
+        """Test requesting no instances returns an empty list."""
+        assert AgentInstance.bulk(AgentRole.TECH_LEAD, 0) == []